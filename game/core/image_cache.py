@@ -0,0 +1,61 @@
+"""
+Image Cache Module
+
+This module provides a small memoizing loader for the game's image assets. Each
+image file is decoded from disk and converted to the display pixel format only
+once; later requests for the same path (and size) return the shared surface.
+This avoids repeated disk I/O and SDL surface conversion every time a Player or
+an Obstacle is created, for instance when the game is restarted. Nothing is loaded
+at import time: each image is decoded the first time it is requested.
+
+Functions:
+    load: Loads (and optionally scales) an image, caching the result.
+
+Dependencies:
+    pygame: A library used for creating games and multimedia applications in Python.
+"""
+
+import pygame
+
+_cache: dict = {}
+
+def load(path: str, width: int = 0, height: int = 0, alpha: bool = True) -> pygame.Surface:
+    """
+    Loads an image, converts it to the display format and optionally resizes it.
+
+    The converted source image is cached per path, and each scaled result per
+    ``(path, width, height)``, so repeated calls skip both the decode
+    and the scale. Images are only loaded on first use, which must happen after
+    ``pygame.display.set_mode`` since the conversion needs a display.
+
+    Args:
+        path (str): The path to the image file.
+        width (int): The desired width of the image (optional).
+        height (int): The desired height of the image (optional).
+        alpha (bool): Whether the image has transparency. Opaque images are converted
+            without a per-pixel alpha channel, which makes them faster to blit.
+
+    Returns:
+        pygame.Surface: The cached image surface.
+    """
+    source_key = (path, alpha)
+    surface = _cache.get(source_key)
+    if surface is None:
+        assert pygame.display.get_surface() is not None, \
+            "image_cache.load() needs pygame.display.set_mode() to be called first"
+        image = pygame.image.load(path)
+        surface = image.convert_alpha() if alpha else image.convert()
+        _cache[source_key] = surface
+
+    width = width or surface.get_width()
+    height = height or surface.get_height()
+    if surface.get_size() == (width, height):
+        # Assets shipped at their display size need no transform
+        return surface
+
+    key = (path, alpha, width, height)
+    scaled = _cache.get(key)
+    if scaled is None:
+        scaled = pygame.transform.scale(surface, (width, height))
+        _cache[key] = scaled
+    return scaled
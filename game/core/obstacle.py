@@ -4,12 +4,17 @@ Obstacle Module
 This module defines the Obstacle class for a game, managing the obstacle's attributes,
 movements, and interactions within the game environment. The Obstacle class handles
 loading the obstacle's image, positioning it randomly on the screen, and updating its
-position based on a specified speed. It also includes methods for drawing the obstacle
-on the screen and managing its collision detection with other game elements.
+position based on a specified speed. Obstacles can be reset to a new spawn position
+so that the ones that left the screen are reused. Obstacles are drawn in a single
+batch with the rest of the scene from their image and rect attributes, and expose
+their hitbox for collision detection with other game elements.
 
 Classes:
     Obstacle: Represents an obstacle in the game.
 
+Functions:
+    spawn_lines: Computes the y-coordinates at which obstacles can spawn.
+
 Dependencies:
     pygame: A library used for creating games and multimedia applications in Python.
     random: A module used to generate random numbers for positioning obstacles.
@@ -18,67 +23,89 @@ Dependencies:
 import random
 import pygame
 
+# Vertical offsets from the bottom of the screen at which obstacles can spawn
+_Y_OFFSETS = (150, 250)
+
+def spawn_lines(height: int) -> tuple:
+    """
+    Computes the y-coordinates at which obstacles can spawn.
+
+    The result only depends on the screen height, so it is meant to be computed once
+    by the obstacle spawner and passed to every new obstacle.
+
+    Args:
+        height (int): The height of the game screen.
+
+    Returns:
+        tuple: The two possible y-coordinates of an obstacle.
+    """
+    return (height - _Y_OFFSETS[0], height - _Y_OFFSETS[1])
+
 class Obstacle(pygame.sprite.Sprite):
     """
     Class representing an obstacle in the game.
 
     Attributes:
-        __height (int): The height of the game screen.
-        __x (int): The x-coordinate of the obstacle.
         __speed (int): The speed at which the obstacle moves.
-        __obstacle_img (pygame.Surface): The image of the obstacle.
-        __rect (pygame.Rect): The rectangle representing the obstacle's position and size.
-        __hitbox (pygame.Rect): The hitbox for collision detection.
+        image (pygame.Surface): The image of the obstacle, drawn in the scene's blit sequence.
+        rect (pygame.Rect): The rectangle representing the obstacle's position and size.
     """
 
-    def __init__(self, x: int, height: int, speed: int, obstacle_img: pygame.Surface) -> None:
+    def __init__(self, x: int, y_lines: tuple, speed: int, obstacle_img: pygame.Surface) -> None:
         """
         Initializes the obstacle with the given parameters.
 
         Args:
             x (int): The initial x-coordinate of the obstacle.
-            height (int): The height of the game screen.
+            y_lines (tuple): The possible y-coordinates, as returned by spawn_lines.
             speed (int): The speed at which the obstacle moves.
             obstacle_img (pygame.Surface): The image of the obstacle.
         """
         super().__init__()
-        self.__height = height
-        self.__speed = speed
-        self.__obstacle_img = obstacle_img
+        self.image = obstacle_img
+        # Use the image size for the rect
+        self.rect = self.image.get_rect()
+        self.reset(x, y_lines, speed)
 
-        # Use the image size for the rect and hitbox
-        y_position = random.choice([self.__height - 150, self.__height - 250])
-        self.__rect = self.__obstacle_img.get_rect(topleft=(x, y_position))
+    def reset(self, x: int, y_lines: tuple, speed: int) -> None:
+        """
+        Moves the obstacle back to a spawn position, so that it can be reused.
 
-        # Smaller hitbox for better collision detection
-        self.__hitbox = self.__rect.inflate(-10, -10)
+        Args:
+            x (int): The new x-coordinate of the obstacle.
+            y_lines (tuple): The possible y-coordinates, as returned by spawn_lines.
+            speed (int): The speed at which the obstacle moves.
+        """
+        self.__speed = speed
+        self.rect.topleft = (x, y_lines[random.getrandbits(1)])
 
     def update(self) -> None:
         """
         Updates the obstacle's position based on its speed.
+
+        Obstacles that left the screen are removed by their spawner, using the
+        frame count returned by frames_to_expire.
         """
-        self.__rect.x -= self.__speed
-        self.__hitbox.topleft = self.__rect.topleft  # Update the hitbox
-        if self.__rect.right < 0:
-            self.kill()
+        self.rect.move_ip(-self.__speed, 0)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def frames_to_expire(self) -> int:
         """
-        Draws the obstacle on the screen.
+        Gets the number of updates after which the obstacle is off the screen.
 
-        Args:
-            screen (pygame.Surface): The game screen to draw on.
+        Returns:
+            int: The number of updates until the obstacle's right edge is below 0.
         """
-        screen.blit(self.__obstacle_img, self.__rect.topleft)
+        return self.rect.right // self.__speed + 1
 
     def get_hitbox(self) -> pygame.Rect:
         """
-        Gets the obstacle's hitbox.
+        Gets the obstacle's hitbox, computed on demand for collision tests.
 
         Returns:
-            pygame.Rect: The obstacle's hitbox.
+            pygame.Rect: The obstacle's hitbox, smaller than its rect for better
+            collision detection.
         """
-        return self.__hitbox
+        return self.rect.inflate(-10, -10)
 
     def get_rect(self) -> pygame.Rect:
         """
@@ -87,4 +114,4 @@ class Obstacle(pygame.sprite.Sprite):
         Returns:
             pygame.Rect: The obstacle's rectangle.
         """
-        return self.__rect
+        return self.rect
@@ -13,24 +13,29 @@ Classes:
 
 Dependencies:
     pygame: A library used for creating games and multimedia applications in Python.
+    image_cache (custom module): Shared cache for the loaded image surfaces.
 """
 
 import pygame
+from . import image_cache
 
 class Player:
     """
     Class representing the player in the game.
 
     Attributes:
-        __height (int): The height of the game screen.
+        __ground_y (int): The y-coordinate the player stands at on the ground.
         __image (pygame.Surface): The player's image.
         __rect (pygame.Rect): The player's collision rectangle.
-        __hitbox (pygame.Rect): The player's hitbox for collisions.
-        __vel_y (int): The player's vertical velocity.
+        __vel_y (float): The player's vertical velocity.
+        __subpixel_y (float): The fractional vertical move not yet applied to the rect.
         __on_ground (bool): Indicates if the player is on the ground.
         __alive (bool): Indicates if the player is alive.
     """
 
+    __slots__ = ('__ground_y', '__image', '__rect', '__vel_y', '__subpixel_y',
+                 '__on_ground', '__alive')
+
     def __init__(self, height: int, player_file_path: str) -> None:
         """
         Initializes the player with the given parameters.
@@ -39,13 +44,11 @@ class Player:
             height (int): The height of the game screen.
             player_file_path (str): The path to the player's image file.
         """
-        self.__height = height
-        self.__image = pygame.transform.scale(pygame.image.load(player_file_path).convert_alpha(),
-                                              (70, 100))
+        self.__ground_y = height - 200
+        self.__image = image_cache.load(player_file_path, 70, 100)
         self.__rect = self.__image.get_rect(topleft=(20, 20))
-        # Smaller hitbox for better collision detection
-        self.__hitbox = self.__rect.inflate(-10, -10)
-        self.__vel_y = 0
+        self.__vel_y = 0.0
+        self.__subpixel_y = 0.0
         self.__on_ground = False
         self.__alive = True
 
@@ -60,25 +63,35 @@ class Player:
             self.__vel_y = jump_strength
             self.__on_ground = False
 
-    def update(self, gravity: int) -> None:
+    def update(self, gravity: float) -> None:
         """
         Updates the player's position based on gravity and velocity.
 
+        The velocity is kept as a float and the fractional part of each move is
+        accumulated, so only whole pixel deltas are applied to the rect.
+
         Args:
-            gravity (int): The gravity affecting the player.
+            gravity (float): The gravity affecting the player.
         """
         if self.__alive:
-            self.__vel_y += gravity
-            self.__rect.y += self.__vel_y
+            # Work on locals and write the attributes back once
+            rect = self.__rect
+            vel_y = self.__vel_y + gravity
+            subpixel_y = self.__subpixel_y + vel_y
+            dy = int(subpixel_y)
+            subpixel_y -= dy
+            rect.move_ip(0, dy)
 
             # Prevent the player from falling below the ground
-            if self.__rect.y >= self.__height - 200:
-                self.__rect.y = self.__height - 200
-                self.__vel_y = 0
+            ground_y = self.__ground_y
+            if rect.y >= ground_y:
+                rect.y = ground_y
+                vel_y = 0.0
+                subpixel_y = 0.0
                 self.__on_ground = True
 
-            # Update the hitbox to follow the player
-            self.__hitbox.topleft = self.__rect.topleft
+            self.__vel_y = vel_y
+            self.__subpixel_y = subpixel_y
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -89,6 +102,17 @@ class Player:
         """
         screen.blit(self.__image, self.__rect.topleft)
 
+    def get_blit_item(self) -> tuple:
+        """
+        Gets the (image, rect) pair drawing the player in a blit sequence.
+
+        The rect is moved in place, so the pair stays valid for the player's lifetime.
+
+        Returns:
+            tuple: The player's image and rectangle.
+        """
+        return (self.__image, self.__rect)
+
     def is_alive(self) -> bool:
         """
         Checks if the player is alive.
@@ -109,9 +133,10 @@ class Player:
 
     def get_hitbox(self) -> pygame.Rect:
         """
-        Gets the player's hitbox.
+        Gets the player's hitbox, computed on demand for collision tests.
 
         Returns:
-            pygame.Rect: The player's hitbox.
+            pygame.Rect: The player's hitbox, smaller than its rect for better
+            collision detection.
         """
-        return self.__hitbox
+        return self.__rect.inflate(-10, -10)
@@ -21,30 +21,67 @@ Usage:
 Dependencies:
     - pygame: For game rendering and event handling.
     - pygame_gui: For managing UI elements.
+    - collections: For the queue of obstacles, sorted by x and by expiry.
     - json: For loading and saving game configuration and scores.
+    - orjson (optional): A faster JSON parser and serializer, used instead of json when installed.
     - datetime: For timestamping saved scores.
+    - heapq: For keeping the 10 best scores of the leaderboard.
     - sys: For system-specific parameters and functions.
-    - time: For handling time-related operations.
-    - pandas: For reading and processing stress data from CSV files.
+    - threading: For reading the stress data file and saving the scores in the background.
+    - os: For checking the size of the stress data file and setting SDL options.
     - helpers (custom module): Utility functions such as loading images and drawing text.
+    - settings (custom module): Immutable gameplay settings read from the configuration.
     - menu (custom module): UI management for the game menu.
     - button (custom module): Custom button handling for UI interactions.
     - player (custom module): Player entity and behavior.
     - obstacle (custom module): Obstacle mechanics and behavior.
+    - image_cache (custom module): Shared cache for the loaded image surfaces.
 """
 
+from collections import deque
 from datetime import datetime
+import heapq
 import json
+import os
 import sys
-import time
-import pandas as pd
+import threading
 import pygame
 import pygame_gui
-from .utils.helpers import load_image, draw_text
+from .utils.helpers import draw_text, render_text, blit_sequence, wait_events
+from .utils.settings import load_game_settings
 from .ui.menu import Menu
 from .ui.button import Button
 from .core.player import Player
-from .core.obstacle import Obstacle
+from .core.obstacle import Obstacle, spawn_lines
+from .core import image_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# States written by the stress detection in the 'State' column of its data file
+_STRESS_STATES = frozenset(('CALM', 'MODERATE', 'STRESSED'))
+
+# Event types handled by the game and its menus, the only ones let into the queue.
+# pygame_gui buttons need the mouse button releases to report a click; hovering is
+# read from the mouse position, so mouse motion events are not needed.
+_ALLOWED_EVENT_TYPES = [pygame.QUIT,
+                        pygame.KEYDOWN,
+                        pygame.MOUSEBUTTONDOWN,
+                        pygame.MOUSEBUTTONUP,
+                        pygame_gui.UI_BUTTON_PRESSED]
+
+# Event types handled by the game loop
+_GAME_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
+# Native box blur, only provided by pygame-ce
+_BOX_BLUR = getattr(pygame.transform, 'box_blur', None)
 
 class Game:
     """
@@ -58,100 +95,190 @@ class Game:
         Args:
             config_filepath (str): The path to the configuration file.
         """
+        # Use SDL's own (SIMD) alpha blitters rather than pygame's
+        os.environ.setdefault('PYGAME_BLEND_ALPHA_SDL2', '1')
         pygame.init()
         pygame.mixer.init()
+        # set_allowed alone does not block the other types: block everything first
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_ALLOWED_EVENT_TYPES)
         pygame.display.set_caption('Emotion Race')
 
-        self.__screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        try:
+            # With vsync, flip() waits for the screen refresh instead of busy-spinning.
+            # pygame only accepts vsync along with SCALED or OPENGL
+            self.__screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.SCALED,
+                                                    vsync=1)
+        except pygame.error:
+            # No vsync on this driver: clock.tick alone paces the loop
+            self.__screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         self.__width, self.__height = self.__screen.get_size()
 
-        self.__config_filepath = config_filepath
-        with open(config_filepath, 'r', encoding='utf-8') as file:
-            self.__config = json.load(file)
+        with open(config_filepath, 'rb') as file:
+            self.__config = _json_loads(file.read())
+        self.__settings = load_game_settings(self.__config)
 
         # Load images and initialize game variables
         self.__load_images()
         self.__initialize_game_variables()
 
     def __load_images(self) -> None:
-        """Load all necessary images for the game."""
-        self.__logout_img = load_image(self.__config['ui_settings']['logout_file_path'], 40, 40)
+        """Load all necessary images for the game, converted to the display format."""
+        ui_settings = self.__config['ui_settings']
+        self.__logout_img = image_cache.load(ui_settings['logout_file_path'], 40, 40)
         self.__logout_rect = self.__logout_img.get_rect(topright=(self.__width - 10, 10))
-        self.__obstacle_img = load_image(self.__config['ui_settings']['obstacle_file_path'], 40, 40)
-        self.__background_img = load_image(self.__config['ui_settings']['background_file_path'],
-                                           self.__width, self.__height)
-        self.__foreground_img = load_image(self.__config['ui_settings']['foreground_file_path'],
-                                           self.__width + 6)
-        self.__game_over_img = load_image(self.__config['ui_settings']['gameover_file_path'],
-                                          self.__width, self.__height)
+        self.__obstacle_img = image_cache.load(ui_settings['obstacle_file_path'], 40, 40)
+        self.__background_img = image_cache.load(ui_settings['background_file_path'],
+                                                 self.__width, self.__height, alpha=False)
+        self.__foreground_img = image_cache.load(ui_settings['foreground_file_path'],
+                                                 self.__width + 6)
+        self.__game_over_img = image_cache.load(ui_settings['gameover_file_path'],
+                                                self.__width, self.__height, alpha=False)
 
     def __initialize_game_variables(self) -> None:
-        """Initialize game variables and settings."""
+        """Initialize the resources and settings kept for the whole session."""
         self.__font_filepath = self.__config['ui_settings']['font_file_path']
         self.__font = pygame.font.Font(self.__font_filepath, 16)
+        self.__font_large = pygame.font.Font(self.__font_filepath, 96)
+        self.__font_huge = pygame.font.Font(self.__font_filepath, 110)
 
         # Initialisation de pygame_gui
         self.__manager = pygame_gui.UIManager((self.__width, self.__height))
         self.__manager.add_font_paths("cybrpnuk", self.__font_filepath)
 
-        self.__background_x1 = 0
-        self.__background_x2 = self.__width
-        self.__foreground_x1 = 0
-        self.__foreground_x2 = self.__width
+        self.__background_speed = self.__settings.background_speed
+        self.__foreground_speed = self.__settings.foreground_speed
+        self.__min_spacing = 200
+        self.__max_spacing = 700
+        self.__spawn_lines = spawn_lines(self.__height)
+        self.__obstacles = pygame.sprite.Group()
+        # (expiry frame, obstacle) pairs, in spawn order: the obstacles share one speed,
+        # so this is also x order and expiry order
+        self.__expiries = deque()
+        # Obstacles that left the screen, reset and reused by the next waves
+        self.__free_obstacles = []
+
+        self.__stress_file_path = self.__config['sensors']['stress_file_path']
+        self.__stress_file = None
+        self.__stress_state_column = None
+        self.__stress_last_size = -1
+        self.__stress_state = 'CALM'
+        self.__stress_stop = threading.Event()
+        self.__stress_thread = None
+
+        self.__pause_text = render_text("Pause - Appuyez sur P pour reprendre",
+                                        self.__font, (255, 255, 255))
+        self.__pause_rect = self.__pause_text.get_rect(
+            topleft=(self.__width // 3 - 2, self.__height // 2 - 2)).clip(self.__screen.get_rect())
+        self.__pause_backdrop = None
+        self.__pause_text_shown = False
+        # Screen subsurface and scratch surfaces of each blur size, keyed by (width, factor)
+        self.__blur_surfaces = {}
+        # Leaderboard, read from its file on the first save and then kept up to date
+        self.__scores = None
+
+        self.__reset_state()
+
+    def __reset_state(self) -> None:
+        """Reset the state of a run, keeping the loaded resources."""
+        # Scrolling offsets of the background and foreground, modulo the screen width
+        self.__background_offset = 0
+        self.__foreground_offset = 0
 
         self.__score = 0
-        self.__speed = self.__config['game_settings']['player_speed_at_beginning']
+        self.__speed = self.__settings.player_speed_at_beginning
         self.__player = Player(self.__height, self.__config['ui_settings']['player_file_path'])
-        self.__nb_obstacles = self.__config['game_settings']['nb_obstacles']
-        self.__min_spacing = 200
-        self.__max_spacing = 700
+        self.__player_blit_item = self.__player.get_blit_item()
+
+        # Obstacles left from a previous run are reused by the first wave
+        expiries = self.__expiries
+        while expiries:
+            obstacle = expiries.popleft()[1]
+            obstacle.kill()
+            self.__free_obstacles.append(obstacle)
+        self.__frame = 0
+        self.__nb_obstacles = self.__settings.nb_obstacles
         self.__spacing = self.__min_spacing + (self.__max_spacing
                                                - self.__min_spacing) * (self.__speed / 40)
-        self.__obstacles = pygame.sprite.Group()
-        self.__obstacles.add(
-            Obstacle((self.__width + i * self.__spacing), self.__height, self.__speed,
-                     self.__obstacle_img) for i in range(self.__nb_obstacles)
-        )
+        self.__spawn_obstacles()
 
-        self.__gravity = self.__config['game_settings']['gravity_min']
-        self.__jump_strength = self.__config['game_settings']['jump_strength_min']
+        self.__gravity = self.__settings.gravity_min
+        self.__jump_strength = self.__settings.jump_strength_min
+        self.__update_hud_values()
         self.__paused = False
 
-        self.__stress_file_path = self.__config['sensors']['stress_file_path']
-        self.__stress_state = 'CALM'
-
+        self.__hud_key = None
+        self.__hud_surface = None
 
     def __monitor_stress(self) -> None:
         """
         Monitors the player's stress level based on the latest recorded state in a CSV file.
 
-        This method reads the stress data file, extracts the last recorded state, 
-        and updates the player's stress state accordingly. If the file does not contain 
-        at least two lines of data, it waits for more data to be available.
-
-        Raises:
-            FileNotFoundError: If the stress data file is not found.
-            pd.errors.ParserError: If the file contains invalid data that cannot be parsed.
+        The stress data file only grows while the sensors are recording, so instead of
+        parsing it entirely, this method reads its last few kilobytes and extracts the
+        state of the last complete line. Nothing is read when the file size did not
+        change since the previous call. If the file does not contain at least two lines
+        of data, it waits for more data to be available.
         """
         try:
-            df = pd.read_csv(self.__stress_file_path)
+            size = os.stat(self.__stress_file_path).st_size
+            if size == self.__stress_last_size:
+                return
 
-            if len(df) < 2:
+            if self.__stress_file is None:
+                # Kept open between calls, closed when quitting the game
+                self.__stress_file = open(  # pylint: disable=consider-using-with
+                    self.__stress_file_path, 'rb')
+            if self.__stress_state_column is None:
+                self.__stress_file.seek(0)
+                header = self.__stress_file.readline().decode('utf-8').strip().split(',')
+                self.__stress_state_column = header.index('State')
+
+            start = max(0, size - 4096)
+            self.__stress_file.seek(start)
+            chunk = self.__stress_file.read(size - start)
+            lines = chunk.splitlines()
+            if not chunk.endswith(b'\n'):
+                lines = lines[:-1]  # The last line is still being written
+            if start == 0:
+                lines = lines[1:]  # Skip the header
+            if len(lines) < 2:
                 print('Waiting for at least 2 lines in the file...')
                 return
 
-            last_state = df.iloc[-1]['State']
+            self.__stress_last_size = size
+            last_state = lines[-1].split(b',')[self.__stress_state_column].strip().decode('utf-8')
 
-            if last_state == 'CALM':
-                self.__stress_state = 'CALM'
-            elif last_state == 'MODERATE':
-                self.__stress_state = 'MODERATE'
-            elif last_state == 'STRESSED':
-                self.__stress_state = 'STRESSED'
+            if last_state in _STRESS_STATES:
+                self.__stress_state = last_state
         except FileNotFoundError:
             print(f"Error: The stress data file '{self.__stress_file_path}' was not found.")
-        except pd.errors.ParserError:
+        except (ValueError, IndexError, UnicodeDecodeError):
             print(f"Error: Unable to parse the stress data file '{self.__stress_file_path}'")
+        except OSError as e:
+            print(f"Error: Unable to read the stress data file '{self.__stress_file_path}': {e}")
+
+    def __stress_worker(self) -> None:
+        """
+        Polls the stress data file every 2 seconds until the monitoring is stopped.
+
+        Runs in a daemon thread so that the file access never blocks the game loop.
+        The only state shared with the game loop is the stress state string, which
+        is replaced by a single attribute assignment, so no lock is needed.
+        """
+        while not self.__stress_stop.wait(2):
+            self.__monitor_stress()
+
+    def __stop_stress_monitoring(self) -> None:
+        """Stops the stress monitoring thread and closes the stress data file."""
+        self.__stress_stop.set()
+        if self.__stress_thread is not None:
+            # Let a read in progress finish before closing the file under it
+            self.__stress_thread.join(timeout=1)
+            self.__stress_thread = None
+        if self.__stress_file is not None:
+            self.__stress_file.close()
+            self.__stress_file = None
 
     def run(self, restart: bool = False) -> None:
         """
@@ -164,39 +291,33 @@ class Game:
         if not restart:
             self.show_start_screen()
         else:
-            self.__initialize_game_variables()
+            self.__reset_state()
 
         running = True
-        time_counter = 0
-        pygame.event.set_allowed([pygame.QUIT,
-                                  pygame.KEYDOWN,
-                                  pygame.MOUSEBUTTONDOWN,
-                                  pygame_gui.UI_BUTTON_PRESSED])
+        if self.__stress_thread is None:
+            self.__stress_thread = threading.Thread(target=self.__stress_worker, daemon=True)
+            self.__stress_thread.start()
         clock = pygame.time.Clock()
 
-        last_time = time.time()
-
         while running:
-            current_time = time.time()
-            elapsed_time = current_time - last_time
-            last_time = current_time
-            time_counter += elapsed_time
-
-            if time_counter >= 2: #Update every 2 seconds
-                self.__monitor_stress()
-                time_counter = 0
             self.__handle_events()
 
             if not self.__paused:
                 self.__update_game()
                 self.__draw_elements()
-
-            pygame.display.flip()
+                pygame.display.flip()
+            else:
+                self.__draw_pause_screen()
             clock.tick(60)
 
     def __handle_events(self) -> None:
-        """Handle game events."""
-        for event in pygame.event.get():
+        """
+        Handle game events.
+
+        Only the event types handled here are fetched, so SDL filters the queue
+        without creating Python event objects for the other types.
+        """
+        for event in pygame.event.get(_GAME_EVENT_TYPES):
             if event.type == pygame.QUIT:
                 self.__quit_game()
             elif event.type == pygame.KEYDOWN:
@@ -207,6 +328,7 @@ class Game:
 
     def __quit_game(self) -> None:
         """Quit the game safely."""
+        self.__stop_stress_monitoring()
         pygame.quit()
         sys.exit()
 
@@ -228,44 +350,73 @@ class Game:
         """Update game state."""
         self.__player.update(self.__gravity)
         if self.__player.is_alive():
+            settings = self.__settings
             self.__score += 1
-            self.__speed = (self.__config['game_settings']['player_speed_at_beginning']
-                            + self.__score // 200)
-            self.__gravity = min(self.__gravity
-                              + 0.001, self.__config['game_settings']['gravity_max'])
-            self.__jump_strength = max(self.__config['game_settings']['jump_strength_min']
-                                    - self.__score // 200,
-                                    self.__config['game_settings']['jump_strength_max'])
-            self.__nb_obstacles = min(self.__config['game_settings']['nb_obstacles']
-                                      + self.__score // 200, 10)
+            self.__speed = settings.player_speed_at_beginning + self.__score // 200
+            self.__gravity = min(self.__gravity + 0.001, settings.gravity_max)
+            self.__jump_strength = max(settings.jump_strength_min - self.__score // 200,
+                                       settings.jump_strength_max)
+            self.__update_hud_values()
+            self.__nb_obstacles = min(settings.nb_obstacles + self.__score // 200, 10)
 
         self.__update_background()
         self.__update_obstacles()
 
+    def __update_hud_values(self) -> None:
+        """Update the gravity and jump strength values shown in the game information."""
+        jump_strength = self.__jump_strength
+        self.__jump_display = -jump_strength if jump_strength < 0 else jump_strength
+        self.__gravity_display = int(self.__gravity)
+
     def __update_background(self) -> None:
         """Update the background position."""
-        for attr in ['_Game__background_x1', '_Game__background_x2']:
-            setattr(self, attr,
-                    getattr(self, attr) - self.__config['game_settings']['background_speed'])
-            if getattr(self, attr) <= -self.__width:
-                setattr(self, attr, self.__width)
-
-        for attr in ['_Game__foreground_x1', '_Game__foreground_x2']:
-            setattr(self, attr,
-                    getattr(self, attr) - self.__config['game_settings']['foreground_speed'])
-            if getattr(self, attr) <= -self.__width:
-                setattr(self, attr, self.__width)
+        width = self.__width
+        self.__background_offset = (self.__background_offset + self.__background_speed) % width
+        self.__foreground_offset = (self.__foreground_offset + self.__foreground_speed) % width
 
-    def __update_obstacles(self) -> None:
-        """Update the obstacles."""
-        self.__obstacles = [obstacle for obstacle in
-                            self.__obstacles if obstacle.get_rect().x >= -40]
+    def __add_obstacle(self, obstacle: Obstacle) -> None:
+        """
+        Add a new obstacle to the game and schedule its removal.
 
-        for obstacle in self.__obstacles:
-            obstacle.update()
-            if self.__player.get_hitbox().colliderect(obstacle.get_hitbox()):
+        Args:
+            obstacle (Obstacle): The obstacle to add.
+        """
+        self.__obstacles.add(obstacle)
+        self.__expiries.append((self.__frame + obstacle.frames_to_expire(), obstacle))
+
+    def __update_obstacles(self) -> None:
+        """Update the obstacles, dropping the ones that left the screen."""
+        self.__obstacles.update()
+
+        # All the obstacles of a wave share the same speed, so they leave the screen
+        # in the order they were spawned: only the front of the queue is checked.
+        frame = self.__frame + 1
+        self.__frame = frame
+        expiries = self.__expiries
+        while expiries and expiries[0][0] <= frame:
+            obstacle = expiries.popleft()[1]
+            obstacle.kill()
+            self.__free_obstacles.append(obstacle)
+
+        # Both hitboxes are their rect shrunk by 5px on each side, so testing the
+        # player hitbox shrunk by another 5px against the obstacle rect is equivalent
+        # and avoids building a hitbox for every obstacle.
+        collision_box = self.__player.get_hitbox().inflate(-10, -10)
+        collide = collision_box.colliderect
+        left, right = collision_box.left, collision_box.right
+        # The queue is sorted by x, so it is swept from the left until the first obstacle
+        # past the player: only the obstacles overlapping it in x are tested.
+        for _, obstacle in expiries:
+            rect = obstacle.rect
+            if rect.right <= left:
+                continue
+            if rect.left >= right:
+                break
+            if collide(rect):
                 self.__player.set_is_alive(False)
                 self.game_over()
+                # One hit ends the game: the other obstacles need no test
+                break
 
         if not self.__obstacles:
             self.__generate_obstacles()
@@ -275,33 +426,32 @@ class Game:
         normalized_speed = min(self.__speed, 20)
         self.__spacing = self.__min_spacing + (self.__max_spacing
                                                - self.__min_spacing) * (normalized_speed / 20)
-        self.__nb_obstacles = min(self.__config['game_settings']['nb_obstacles']
-                                  + self.__score // 100, 10)
-
-        if not self.__obstacles:
-            self.__obstacles = [
-                Obstacle(self.__width + i * self.__spacing,
-                         self.__height, self.__speed, self.__obstacle_img)
-                for i in range(self.__nb_obstacles)
-            ]
-        else:
-            self.__obstacles.add(
-                Obstacle(self.__width + i * self.__spacing,
-                        self.__height, self.__speed, self.__obstacle_img)
-                for i in range(self.__nb_obstacles)
-            )
+        self.__nb_obstacles = min(self.__settings.nb_obstacles + self.__score // 100, 10)
+        self.__spawn_obstacles()
+
+    def __spawn_obstacles(self) -> None:
+        """Spawn a wave of obstacles off the right of the screen, reusing free ones."""
+        # The constructor arguments are the same for the whole wave, except x
+        spacing = self.__spacing
+        width = self.__width
+        spawn_lines_y = self.__spawn_lines
+        speed = self.__speed
+        obstacle_img = self.__obstacle_img
+        add_obstacle = self.__add_obstacle
+        free_obstacles = self.__free_obstacles
+        for i in range(self.__nb_obstacles):
+            x = width + i * spacing
+            if free_obstacles:
+                obstacle = free_obstacles.pop()
+                obstacle.reset(x, spawn_lines_y, speed)
+            else:
+                obstacle = Obstacle(x, spawn_lines_y, speed, obstacle_img)
+            add_obstacle(obstacle)
 
     def __draw_elements(self) -> None:
         """Draw all game elements on the screen."""
-        self.__draw_background()
+        self.__draw_scene()
         self.__draw_game_info()
-        self.__player.draw(self.__screen)
-
-        for obstacle in self.__obstacles:
-            obstacle.draw(self.__screen)
-
-        if self.__paused:
-            self.__draw_pause_screen()
 
         if self.__stress_state != 'CALM':
             if self.__stress_state == 'MODERATE':
@@ -311,41 +461,100 @@ class Game:
 
         self.__screen.blit(self.__logout_img, self.__logout_rect.topleft)
 
-    def __draw_background(self) -> None:
-        """Draw the background and foreground images."""
-        self.__screen.blit(self.__background_img,
-                           (self.__background_x1, 0))
-        self.__screen.blit(self.__background_img,
-                           (self.__background_x2, 0))
-        self.__screen.blit(self.__foreground_img,
-                           (self.__foreground_x1, self.__height - 110))
-        self.__screen.blit(self.__foreground_img,
-                           (self.__foreground_x2, self.__height - 110))
+    def __draw_scene(self) -> None:
+        """
+        Draw the background, foreground, player and obstacles.
+
+        Everything is drawn by a single blit sequence, in that order, instead of one
+        blit call per image.
+        """
+        background_img = self.__background_img
+        foreground_img = self.__foreground_img
+        width = self.__width
+        background_offset = self.__background_offset
+        foreground_offset = self.__foreground_offset
+        foreground_y = self.__height - 110
+        # Each layer is drawn twice, side by side, to cover the whole screen
+        sequence = [
+            (background_img, (-background_offset, 0)),
+            (background_img, (width - background_offset, 0)),
+            (foreground_img, (-foreground_offset, foreground_y)),
+            (foreground_img, (width - foreground_offset, foreground_y)),
+            self.__player_blit_item,
+        ]
+        sequence.extend([(obstacle.image, obstacle.rect) for obstacle in self.__obstacles])
+        blit_sequence(self.__screen, sequence)
 
     def __draw_blurred_background(self, width : int, factor : int) -> None:
-        """Draw a blurred background when the player is stressed."""
-        blur_area = pygame.Rect(0, 0, width, self.__height)
-        sub_surface = self.__screen.subsurface(blur_area).copy()
-        small_surface = pygame.transform.smoothscale(sub_surface,
-                                                     (sub_surface.get_width() // factor,
-                                                      sub_surface.get_height() // factor))
-        blurred_sub_surface = pygame.transform.smoothscale(small_surface,
-                                                           (sub_surface.get_width(),
-                                                            sub_surface.get_height()))
-        self.__screen.blit(blurred_sub_surface, blur_area.topleft)
+        """
+        Draw a blurred background when the player is stressed.
+
+        Uses pygame-ce's native box blur when available, and otherwise blurs by
+        scaling the area down by `factor` and back up. The intermediate surfaces are
+        allocated once per blur size and reused on the following frames.
+
+        Args:
+            width (int): The width of the blurred area, from the left of the screen.
+            factor (int): The strength of the blur.
+        """
+        surfaces = self.__blur_surfaces.get((width, factor))
+        if surfaces is None:
+            # The screen subsurface shares the screen pixels, so it stays up to date
+            screen = self.__screen
+            sub_surface = screen.subsurface((0, 0, width, self.__height))
+            small_surface = pygame.Surface((max(1, width // factor),
+                                            max(1, self.__height // factor)), 0, screen)
+            blurred_surface = pygame.Surface(sub_surface.get_size(), 0, screen)
+            surfaces = (sub_surface, small_surface, blurred_surface)
+            self.__blur_surfaces[(width, factor)] = surfaces
+
+        sub_surface, small_surface, blurred_surface = surfaces
+        if _BOX_BLUR is not None:
+            _BOX_BLUR(sub_surface, factor // 2, dest_surface=blurred_surface)
+        else:
+            pygame.transform.smoothscale(sub_surface, small_surface.get_size(),
+                                         dest_surface=small_surface)
+            pygame.transform.smoothscale(small_surface, blurred_surface.get_size(),
+                                         dest_surface=blurred_surface)
+        self.__screen.blit(blurred_surface, (0, 0))
 
     def __draw_game_info(self) -> None:
-        """Draw game information such as score and speed."""
-        info_text = f"Score : {self.__score} | Vitesse : {self.__speed} | "
-        info_text += f"Gravité : {int(self.__gravity)} | Force de saut : "
-        info_text += f"{abs(self.__jump_strength)} | Stress : {self.__stress_state}"
-        draw_text(self.__screen, info_text, self.__font, (255, 255, 255), 60, 10)
+        """
+        Draw game information such as score and speed.
+
+        The score changes every frame, so it is rendered on its own. The rest of the
+        line only changes a few times per second, so it is rendered once and kept
+        until one of its values changes.
+        """
+        key = (self.__speed, self.__gravity_display, self.__jump_display, self.__stress_state)
+        if key != self.__hud_key:
+            self.__hud_key = key
+            self.__hud_surface = render_text(
+                f"Vitesse : {key[0]} | Gravité : {key[1]} | Force de saut : "
+                f"{key[2]} | Stress : {key[3]}", self.__font, (255, 255, 255))
+
+        score_surface = render_text(f"Score : {self.__score} | ", self.__font, (255, 255, 255))
+        # Outlined surfaces are 2px larger on each side than the text they hold
+        blit_sequence(self.__screen, (
+            (score_surface, (58, 8)),
+            (self.__hud_surface, (58 + score_surface.get_width() - 4, 8)),
+        ))
 
     def __draw_pause_screen(self) -> None:
-        """Draw the pause screen."""
-        if pygame.time.get_ticks() // 500 % 2 == 0:  # Clignotement toutes les 500ms
-            draw_text(self.__screen, "Pause - Appuyez sur P pour reprendre",
-                      self.__font, (255, 255, 255), self.__width // 3, self.__height // 2)
+        """
+        Draw the pause screen.
+
+        The game frame stays frozen while paused, so only the area of the blinking
+        pause text is redrawn and sent to the display, and only when it blinks.
+        """
+        shown = pygame.time.get_ticks() // 500 % 2 == 0  # Clignotement toutes les 500ms
+        if shown == self.__pause_text_shown:
+            return
+        self.__pause_text_shown = shown
+        self.__screen.blit(self.__pause_text if shown else self.__pause_backdrop,
+                           self.__pause_rect)
+        pygame.display.update(self.__pause_rect)
+
     def start_music(self) -> None:
         """Start the background music."""
         pygame.mixer.music.load(self.__config['ui_settings']['song_file_path'])
@@ -355,18 +564,22 @@ class Game:
         """Show the start screen with the main menu."""
         main_menu = Menu(self.__screen, self.__width, self.__height,
                          self.__manager, self.__font_filepath)
-        main_menu.show(self.__background_img, pygame.font.Font(self.__font_filepath, 110))
+        main_menu.show(self.__background_img, self.__font_huge)
 
     def toggle_pause(self) -> None:
         """Toggle the pause state of the game."""
         self.__paused = not self.__paused
+        if self.__paused:
+            # Keep the frozen frame under the pause text, to erase the text when it blinks
+            self.__pause_backdrop = self.__screen.subsurface(self.__pause_rect).copy()
+            self.__pause_text_shown = False
 
     def game_over(self) -> None:
         """Handle the game over state and display the game over screen."""
         self.__manager.clear_and_reset()
         self.__screen.blit(self.__game_over_img, (0, 0))
         draw_text(self.__screen, "SCORE : " + str(self.__score),
-                  pygame.font.Font(self.__font_filepath, 96), (255, 255, 255),
+                  self.__font_large, (255, 255, 255),
                   self.__width // 4 + 100, self.__height // 2 + 120)
 
         button_save = Button(self.__screen, self.__width // 2 - 100, self.__height // 5,
@@ -394,7 +607,7 @@ class Game:
             button_quit (Button): The quit game button.
         """
         while True:
-            for event in pygame.event.get():
+            for event in wait_events():
                 self.__manager.process_events(event)
                 if event.type == pygame_gui.UI_BUTTON_PRESSED:
                     if event.ui_element == button_save.get_button():
@@ -406,33 +619,38 @@ class Game:
                         sys.exit()
 
     def restart_game(self) -> None:
-        """Restart the game by creating a new instance and running it."""
-        new_game_instance = self.__class__(self.__config_filepath)
-        new_game_instance.run(restart=True)
+        """
+        Restart the game by resetting its state and running it again.
+
+        The display, images, fonts and stress monitoring of the session are kept.
+        """
+        self.run(restart=True)
 
     def save_score(self) -> None:
         """Save the player's score to the leaderboard."""
         player_name = self.get_player_pseudo()
         pygame.display.update()
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        scores = self.load_scores()
+        if self.__scores is None:
+            self.__scores = self.load_scores()
 
         new_score = {
             'name': player_name,
             'score': self.__score,
             'date': current_time
         }
-        scores.append(new_score)
-        scores.sort(key=lambda x: x['score'], reverse=True)
+        # Same order as a stable descending sort, without sorting the whole list
+        scores = heapq.nlargest(10, self.__scores + [new_score], key=lambda x: x['score'])
+        self.__scores = scores
 
-        if len(scores) > 10:
-            scores = scores[:10]
-
-        self.save_scores(scores)
         try:
             player_rank = scores.index(new_score)
         except ValueError:
             player_rank = -1
+        if player_rank != -1:
+            # The file is only read back on the next session: write it in the background.
+            # The thread is not a daemon, so quitting waits for the write to finish.
+            threading.Thread(target=self.save_scores, args=(list(scores),)).start()
         self.show_leaderboard(scores, player_rank)
 
     def load_scores(self) -> list:
@@ -443,9 +661,9 @@ class Game:
             list: A list of score dictionaries.
         """
         try:
-            with open(self.__config['ui_settings']['leaderboard_file_path'],
-                      'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.__config['ui_settings']['leaderboard_file_path'], 'rb') as f:
+                return _json_loads(f.read())
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
         except (FileNotFoundError, json.JSONDecodeError):
             return []
 
@@ -456,9 +674,8 @@ class Game:
         Args:
             scores (list): A list of score dictionaries to save.
         """
-        with open(self.__config['ui_settings']['leaderboard_file_path'],
-                  'w', encoding='utf-8') as f:
-            json.dump(scores, f)
+        with open(self.__config['ui_settings']['leaderboard_file_path'], 'wb') as f:
+            f.write(_json_dumps(scores))
 
     def get_player_pseudo(self) -> str:
         """
@@ -475,8 +692,22 @@ class Game:
         text = ''
         done = False
 
+        # Nothing changes on this screen until the user acts: draw it, then wait for the
+        # next input before redrawing
         while not done:
-            for event in pygame.event.get():
+            self.__manager.clear_and_reset()
+            self.__screen.blit(self.__background_img, (0, 0))
+            draw_text(self.__screen, "Entrez votre pseudo :", self.__font, (255, 255, 255),
+                      self.__width // 3, self.__height // 2)
+            txt_surface = self.__font.render(text, True, color)
+            width = max(200, txt_surface.get_width() + 10)
+            input_box.w = width
+            self.__screen.blit(txt_surface, (input_box.x + 5, input_box.y + 5))
+            pygame.draw.rect(self.__screen, color, input_box, 2)
+
+            pygame.display.update()
+
+            for event in wait_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -495,19 +726,6 @@ class Game:
                         else:
                             text += event.unicode
 
-            self.__manager.clear_and_reset()
-            self.__screen.blit(load_image(self.__config['ui_settings']['background_file_path'],
-                                          self.__width, self.__height))
-            draw_text(self.__screen, "Entrez votre pseudo :", self.__font, (255, 255, 255),
-                      self.__width // 3, self.__height // 2)
-            txt_surface = self.__font.render(text, True, color)
-            width = max(200, txt_surface.get_width() + 10)
-            input_box.w = width
-            self.__screen.blit(txt_surface, (input_box.x + 5, input_box.y + 5))
-            pygame.draw.rect(self.__screen, color, input_box, 2)
-
-            pygame.display.update()
-
         return text
 
     def show_leaderboard(self, scores: list, player_rank: int) -> None:
@@ -519,8 +737,7 @@ class Game:
             player_rank (int): The rank of the player's score.
         """
         self.__manager.clear_and_reset()
-        self.__screen.blit(load_image(self.__config['ui_settings']['background_file_path'],
-                                      self.__width, self.__height))
+        self.__screen.blit(self.__background_img, (0, 0))
         draw_text(self.__screen, "Leaderboard : ", self.__font, (255, 255, 255),
                   self.__width // 3, self.__height // 4)
         for i, score in enumerate(scores[:10]):
@@ -550,7 +767,7 @@ class Game:
             button_quit (Button): The quit game button.
         """
         while True:
-            for event in pygame.event.get():
+            for event in wait_events():
                 self.__manager.process_events(event)
                 if event.type == pygame_gui.UI_BUTTON_PRESSED:
                     if event.ui_element == button_restart.get_button():
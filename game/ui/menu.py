@@ -14,7 +14,20 @@ Classes:
 import sys
 import pygame
 import pygame_gui
-from game.utils.helpers import draw_text
+from game.utils.helpers import render_text
+
+# Lines of the game description shown under the title
+_DESCRIPTION_LINES = (
+    "Dans Emotion Race, tu incarnes un ninja légendaire, pris dans une course",
+    "effrénée contre ses propres émotions. Chaque mouvement, chaque action est",
+    "influencé par ton état émotionnel. Si tu laisses le stress t'envahir, ton",
+    "personnage sautera moins haut, et les obstacles deviendront de plus en plus",
+    "nombreux, rendant la course encore plus difficile. La peur, la colère,",
+    "le doute... chaque émotion incontrôlée te ralentit, te rend plus",
+    "vulnérable. Mais si tu parviens à maîtriser tes émotions, tu retrouveras",
+    "ton calme et tu pourras surmonter les défis qui se dressent devant toi.",
+    "Reste calme, surpasse-toi, et gagne la course de ton destin!",
+)
 
 class Menu:
     """
@@ -26,6 +39,7 @@ class Menu:
         __height (int): The height of the screen.
         __manager (pygame_gui.UIManager): The UI manager handling the menu.
         __font_filepath (str): The file path to the font used in the menu.
+        __paragraph_font (pygame.font.Font): The font of the game description.
         __start_button (pygame_gui.elements.UIButton): The start game button.
         __quit_button (pygame_gui.elements.UIButton): The quit game button.
     """
@@ -47,6 +61,7 @@ class Menu:
         self.__height = height
         self.__manager = manager
         self.__font_filepath = font_filepath
+        self.__paragraph_font = pygame.font.Font(self.__font_filepath, 24)
         self.__start_button = pygame_gui.elements.UIButton(
             relative_rect=pygame.Rect(self.__width // 2 - 200, 5 * (self.__height // 6), 100, 50),
             text="Start Game",
@@ -66,23 +81,17 @@ class Menu:
             background_img (pygame.Surface): The background image of the menu.
             font (pygame.font.Font): The font used for drawing text.
         """
+        # The texts never change while the menu is shown: render them once
+        title_surface = render_text("Emotion Race", font, (255, 255, 255))
+        description_surface = self.__render_description()
+
         self.__screen.blit(background_img, (0, 0))
         running = True
         while running:
-            draw_text(self.__screen, "Emotion Race", font, (255, 255, 255),
-                      self.__width // 4, self.__height // 15)
-            draw_text(self.__screen, (
-                "Dans Emotion Race, tu incarnes un ninja légendaire, pris dans une course\n\n"
-                "effrénée contre ses propres émotions. Chaque mouvement, chaque action est\n\n"
-                "influencé par ton état émotionnel. Si tu laisses le stress t'envahir, ton\n\n"
-                "personnage sautera moins haut, et les obstacles deviendront de plus en plus\n\n"
-                "nombreux, rendant la course encore plus difficile. La peur, la colère,\n\n"
-                "le doute... chaque émotion incontrôlée te ralentit, te rend plus\n\n"
-                "vulnérable. Mais si tu parviens à maîtriser tes émotions, tu retrouveras\n\n"
-                "ton calme et tu pourras surmonter les défis qui se dressent devant toi.\n\n"
-                "Reste calme, surpasse-toi, et gagne la course de ton destin!"
-            ), pygame.font.Font(self.__font_filepath, 24), (255, 255, 255),
-            self.__width // 7, self.__height // 4)
+            # Outlined surfaces are 2px larger on each side than the text they hold
+            self.__screen.blit(title_surface, (self.__width // 4 - 2, self.__height // 15 - 2))
+            self.__screen.blit(description_surface,
+                               (self.__width // 7 - 2, self.__height // 4 - 2))
 
             for event in pygame.event.get():
                 self.__manager.process_events(event)
@@ -96,3 +105,20 @@ class Menu:
             self.__manager.update(1 / 60)
             self.__manager.draw_ui(self.__screen)
             pygame.display.flip()
+
+    def __render_description(self) -> pygame.Surface:
+        """
+        Renders the outlined game description into a single transparent surface.
+
+        Returns:
+            pygame.Surface: The description, one line every two line heights.
+        """
+        line_surfaces = [render_text(line, self.__paragraph_font, (255, 255, 255))
+                         for line in _DESCRIPTION_LINES]
+        line_height = 2 * self.__paragraph_font.get_linesize()
+        surface = pygame.Surface((max(line.get_width() for line in line_surfaces),
+                                  line_height * (len(line_surfaces) - 1)
+                                  + line_surfaces[-1].get_height()), pygame.SRCALPHA)
+        for i, line in enumerate(line_surfaces):
+            surface.blit(line, (0, i * line_height))
+        return surface
@@ -3,12 +3,17 @@ utils.py
 
 This module provides utility functions for the Emotion Race game, including:
 
-- `draw_text`: Draws text on the screen with an outline.
+- `draw_text`: Draws text on the screen with an outline, reusing the renders of
+  recently drawn texts.
+- `render_text`: Renders outlined text once into a surface that can be blitted later.
+- `blit_sequence`: Draws several surfaces on the screen in a single call.
+- `wait_events`: Waits for user input and returns the pending events.
 - `load_image`: Loads and resizes images.
 - `play_music`: Plays background music in a loop.
 
 Dependencies:
     - pygame: Used for rendering text, loading images, and handling audio.
+    - functools: Used to cache the rendered texts.
 
 Usage Example:
     screen = pygame.display.set_mode((800, 600))
@@ -23,13 +28,25 @@ Usage Example:
 
 Author: [Damien RIANDIERE]
 """
+import functools
 import pygame
 
+# Surface.fblits is only provided by pygame-ce
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+# Positions of the outline copies (left, right, top, bottom) and of the main text,
+# in multiples of the outline width, inside the surface built by render_text
+_OUTLINE_OFFSETS = ((0, 1), (2, 1), (1, 0), (1, 2))
+_TEXT_OFFSET = (1, 1)
+
 def draw_text(screen: pygame.Surface, text: str, font: pygame.font.Font,
               color: tuple, x: int, y: int, outline_width: int = 2) -> None:
     """
     Draws text on the screen with an outline.
 
+    The outlined text is rendered by `render_text` and cached, so a text drawn again
+    with the same font and color, as on every frame of a menu, is only blitted.
+
     Args:
         screen (pygame.Surface): The screen to draw on.
         text (str): The text to draw.
@@ -39,21 +56,85 @@ def draw_text(screen: pygame.Surface, text: str, font: pygame.font.Font,
         y (int): The y-coordinate of the text's position.
         outline_width (int): The width of the text outline.
     """
+    surface = _render_text_cached(text, font, color, outline_width)
+    screen.blit(surface, (x - outline_width, y - outline_width))
+
+@functools.lru_cache(maxsize=256)
+def _render_text_cached(text: str, font: pygame.font.Font, color: tuple,
+                        outline_width: int) -> pygame.Surface:
+    """Memoized `render_text`, keyed by the text, the font object and the color."""
+    return render_text(text, font, color, outline_width)
+
+def render_text(text: str, font: pygame.font.Font, color: tuple,
+                outline_width: int = 2) -> pygame.Surface:
+    """
+    Renders text with an outline into a single transparent surface.
+
+    The result looks like the output of `draw_text`, but can be kept and blitted
+    again as long as the text does not change. Blit it at
+    (x - outline_width, y - outline_width) to match `draw_text` at (x, y).
+
+    Args:
+        text (str): The text to render.
+        font (pygame.font.Font): The font to use for the text.
+        color (tuple): The color of the text (RGB).
+        outline_width (int): The width of the text outline.
+
+    Returns:
+        pygame.Surface: The rendered text, outline included.
+    """
     text_surface = font.render(text, True, color)
     outline_surface = font.render(text, True, (0, 0, 0))  # Black outline
 
-    offsets = [(-outline_width, 0), (outline_width, 0), (0, -outline_width), (0, outline_width)]
-
+    surface = pygame.Surface((text_surface.get_width() + 2 * outline_width,
+                              text_surface.get_height() + 2 * outline_width), pygame.SRCALPHA)
     # Draw only in 4 directions (left, right, top, bottom) for efficiency
-    for dx, dy in offsets:
-        screen.blit(outline_surface, (x + dx, y + dy))
+    sequence = [(outline_surface, (dx * outline_width, dy * outline_width))
+                for dx, dy in _OUTLINE_OFFSETS]
+    sequence.append((text_surface, (_TEXT_OFFSET[0] * outline_width,
+                                    _TEXT_OFFSET[1] * outline_width)))
+    blit_sequence(surface, sequence)
+    return surface
+
+def blit_sequence(screen: pygame.Surface, sequence) -> None:
+    """
+    Draws several surfaces on the screen in a single call.
+
+    Uses `Surface.fblits` when available (pygame-ce), and `Surface.blits` otherwise,
+    so that the whole sequence is drawn by one C loop instead of one Python call
+    per surface.
+
+    Args:
+        screen (pygame.Surface): The screen to draw on.
+        sequence (Sequence): The (surface, position) pairs to draw, in order.
+    """
+    if _HAS_FBLITS:
+        screen.fblits(sequence)
+    else:
+        screen.blits(sequence, doreturn=False)
 
-    screen.blit(text_surface, (x, y))  # Main text
+def wait_events() -> list:
+    """
+    Waits until at least one event is available and returns all the pending events.
+
+    Unlike polling `pygame.event.get` in a loop, the process sleeps while there is no
+    input, which suits the screens that only change when the user acts.
+
+    Returns:
+        list: The pending events, oldest first.
+    """
+    events = [pygame.event.wait()]
+    events.extend(pygame.event.get())
+    return events
 
 def load_image(image_path: str, width: int = 0, height: int = 0) -> pygame.Surface:
     """
     Loads an image from a file and optionally resizes it.
 
+    Once the display is set up, the image is converted to the display pixel format,
+    keeping per-pixel alpha only for images that have it, so that blitting it does
+    not convert every pixel again.
+
     Args:
         image_path (str): The path to the image file.
         width (int): The desired width of the image (optional).
@@ -68,9 +149,14 @@ def load_image(image_path: str, width: int = 0, height: int = 0) -> pygame.Surfa
         print(f"Erreur lors du chargement de l'image {image_path}: {e}")
         return None
 
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+
     # Determine the new size
     new_width = width if width else image.get_width()
     new_height = height if height else image.get_height()
+    if image.get_size() == (new_width, new_height):
+        return image
 
     return pygame.transform.scale(image, (new_width, new_height))
 
@@ -0,0 +1,54 @@
+"""
+settings.py
+
+This module provides the immutable gameplay settings of the Emotion Race game:
+
+- `GameSettings`: A named tuple holding the values of the `game_settings` section
+  of the game configuration file.
+- `load_game_settings`: Builds a `GameSettings` from the loaded configuration.
+
+The settings are read once when the game starts. Being a named tuple, they cannot be
+modified afterwards, and reading a field is a plain tuple index, which keeps the
+per-frame update code free of nested dictionary lookups.
+
+Usage Example:
+    settings = load_game_settings(config)
+    gravity = min(gravity + 0.001, settings.gravity_max)
+"""
+from typing import NamedTuple
+
+class GameSettings(NamedTuple):
+    """
+    Gameplay settings loaded from the `game_settings` section of the configuration.
+
+    Attributes:
+        gravity_min (float): The gravity at the beginning of a run.
+        gravity_max (float): The maximum gravity.
+        jump_strength_min (int): The jump strength at the beginning of a run.
+        jump_strength_max (int): The maximum jump strength.
+        player_speed_at_beginning (int): The speed at the beginning of a run.
+        background_speed (int): The scrolling speed of the background.
+        foreground_speed (int): The scrolling speed of the foreground.
+        nb_obstacles (int): The number of obstacles at the beginning of a run.
+    """
+    gravity_min: float
+    gravity_max: float
+    jump_strength_min: int
+    jump_strength_max: int
+    player_speed_at_beginning: int
+    background_speed: int
+    foreground_speed: int
+    nb_obstacles: int
+
+def load_game_settings(config: dict) -> GameSettings:
+    """
+    Builds the gameplay settings from the loaded configuration.
+
+    Args:
+        config (dict): The whole game configuration.
+
+    Returns:
+        GameSettings: The gameplay settings.
+    """
+    game_settings = config['game_settings']
+    return GameSettings(*(game_settings[field] for field in GameSettings._fields))
@@ -0,0 +1,195 @@
+"""
+ECG Analysis Module
+===================
+
+This module implements the analysis of the ECG signal of the stress detection
+system: the detection of the R peaks with Elgendi's two moving averages method, and
+the heart rate and HRV metrics computed from the intervals between them.
+
+Classes:
+--------
+RPeakDetector:
+    Finds the R peaks of an ECG signal, reusing its filters and work buffers from one
+    call to the next.
+
+Functions:
+----------
+rr_statistics:
+    Accumulates the statistics of the RR intervals in a single loop.
+hrv_metrics:
+    Calculates the heart rate, SDNN, RMSSD and PNN50 from the R peaks.
+block_peaks:
+    Finds one R peak per block of interest of Elgendi's method.
+
+Dependencies:
+-------------
+- numpy: Library for numerical operations.
+- scipy: Library for signal processing (QRS filtering and moving averages).
+- numba (optional): JIT compiler for the R peak search and the HRV metrics, which run
+  as plain Python when it is not installed.
+"""
+import numpy as np
+from scipy.ndimage import uniform_filter1d
+from scipy.signal import butter, sosfiltfilt
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*_args, **_kwargs):
+        """
+        Stand-in for numba.njit when Numba is not installed: leaves the function as is.
+        """
+        return lambda function: function
+
+@njit(cache=True, fastmath=True, nogil=True)
+def rr_statistics(peaks: np.ndarray, sampling_rate: float) -> tuple:
+    """
+    Accumulate the statistics of the RR intervals between R peaks in a single loop.
+
+    Welford's algorithm gives their mean and sum of squared deviations, and running
+    sums of the successive differences give the inputs of RMSSD and PNN50, so that no
+    temporary array is allocated.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    diff_sumsq = 0.0
+    nn50 = 0
+    previous_rr = 0.0
+    for i in range(1, len(peaks)):
+        rr = (peaks[i] - peaks[i - 1]) / sampling_rate
+        count += 1
+        delta = rr - mean
+        mean += delta / count
+        m2 += delta * (rr - mean)
+        if count > 1:
+            diff = rr - previous_rr
+            diff_sumsq += diff * diff
+            if abs(rr * 1000 - previous_rr * 1000) > 50:
+                nn50 += 1
+        previous_rr = rr
+    return count, mean, m2, diff_sumsq, nn50
+
+@njit(cache=True, fastmath=True, nogil=True)
+def hrv_metrics(peaks: np.ndarray, sampling_rate: float) -> tuple:
+    """
+    Calculate heart rate and HRV metrics from the positions of the R peaks.
+    """
+    count, mean, m2, diff_sumsq, nn50 = rr_statistics(peaks, sampling_rate)
+
+    heart_rate = 60 / mean
+    sdnn = np.sqrt(m2 / count) * 1000
+    if count < 2:
+        return heart_rate, sdnn, 0.0, 0.0
+    rmssd = np.sqrt(diff_sumsq / (count - 1)) * 1000
+    pnn50 = nn50 / (count - 1) * 100
+    return heart_rate, sdnn, rmssd, pnn50
+
+@njit(cache=True, nogil=True)
+def block_peaks(squared: np.ndarray, edges: np.ndarray, qrs_width: int,
+                refractory: int) -> np.ndarray:
+    """
+    Find one R peak per block of interest of Elgendi's method, at the block maximum.
+
+    Blocks narrower than a QRS complex are skipped, and the peaks of two blocks closer
+    than the refractory period are merged into the highest one.
+    """
+    peaks = np.empty(len(edges) // 2, dtype=np.int64)
+    count = 0
+    for k in range(0, len(edges) - 1, 2):
+        start = edges[k]
+        end = edges[k + 1]
+        if end - start < qrs_width:
+            continue
+        peak = start
+        for i in range(start + 1, end):
+            if squared[i] > squared[peak]:
+                peak = i
+        if count > 0 and peak - peaks[count - 1] < refractory:
+            # Two blocks of the same beat: keep the highest peak
+            if squared[peak] > squared[peaks[count - 1]]:
+                peaks[count - 1] = peak
+            continue
+        peaks[count] = peak
+        count += 1
+    return peaks[:count]
+
+class RPeakDetector:
+    """
+    Detector of the R peaks of an ECG signal, with Elgendi's two moving averages method.
+
+    The QRS band-pass filters, keyed by sampling rate, and the work buffers of the
+    moving averages are kept between calls, so that the detection allocates as little
+    as possible.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Allocate the work buffers for signals of up to size samples.
+        """
+        # QRS band-pass filters, keyed by sampling rate
+        self.qrs_filters = {}
+        # Work buffers, reused at each detection
+        self.ma_qrs = np.empty(size, dtype=np.float32)
+        self.ma_beat = np.empty(size, dtype=np.float32)
+        self.qrs_blocks = np.empty(size, dtype=bool)
+
+    def detect(self, ecg_data: np.ndarray, sampling_rate: int = 1000) -> np.ndarray:
+        """
+        Find the R peaks of an ECG signal with Elgendi's two moving averages method.
+
+        The signal is band-passed to the QRS band (8-20 Hz) and squared. Samples where
+        the short (QRS-long) moving average exceeds the long (beat-long) one, plus an
+        offset proportional to the mean energy, form blocks of interest. Each block
+        wide enough to be a QRS complex yields one peak, at its maximum. Since the
+        threshold follows the signal energy, no second pass with a lower threshold is
+        needed.
+        """
+        squared = self.qrs_energy(ecg_data, sampling_rate)
+        edges = self.qrs_block_edges(squared, sampling_rate)
+        return block_peaks(squared, edges, int(0.097 * sampling_rate),
+                           int(0.25 * sampling_rate))
+
+    def qrs_energy(self, ecg_data: np.ndarray, sampling_rate: int) -> np.ndarray:
+        """
+        Band-pass an ECG signal to the QRS band (8-20 Hz) and square it.
+        """
+        qrs_filter = self.qrs_filters.get(sampling_rate)
+        if qrs_filter is None:
+            # In float32 like the signal, so that the filtering does not upcast it to float64
+            qrs_filter = butter(3, [8, 20], btype='band', fs=sampling_rate,
+                                output='sos').astype(np.float32)
+            self.qrs_filters[sampling_rate] = qrs_filter
+
+        squared = sosfiltfilt(qrs_filter, ecg_data.astype(np.float32, copy=False))
+        squared *= squared
+        return squared
+
+    def qrs_block_edges(self, squared: np.ndarray, sampling_rate: int) -> np.ndarray:
+        """
+        Find the blocks of interest of the squared QRS band signal.
+
+        Returns the start and end indices of the blocks, alternately.
+        """
+        size = len(squared)
+        if len(self.ma_qrs) < size:
+            self.ma_qrs = np.empty(size, dtype=np.float32)
+            self.ma_beat = np.empty(size, dtype=np.float32)
+            self.qrs_blocks = np.empty(size, dtype=bool)
+        ma_qrs = self.ma_qrs[:size]
+        ma_beat = self.ma_beat[:size]
+        blocks = self.qrs_blocks[:size]
+
+        # The moving averages and the comparison are written in place into the work buffers
+        uniform_filter1d(squared, int(0.097 * sampling_rate), output=ma_qrs)
+        uniform_filter1d(squared, int(0.611 * sampling_rate), output=ma_beat)
+        ma_beat += 0.08 * np.mean(squared)
+        np.greater(ma_qrs, ma_beat, out=blocks)
+
+        # Block edges are the samples where the block state changes from the previous one
+        edges = np.flatnonzero(blocks[1:] ^ blocks[:-1]) + 1
+        if blocks[0]:
+            edges = np.insert(edges, 0, 0)
+        if blocks[-1]:
+            edges = np.append(edges, size)
+        return edges
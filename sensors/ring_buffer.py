@@ -0,0 +1,79 @@
+"""
+Ring Buffer Module
+==================
+
+This module implements the fixed-size ring buffers in which the stress detection
+system keeps the last seconds of the sensor signals. Samples are written in place,
+overwriting the oldest ones, so that no array is reallocated while recording.
+
+Classes:
+--------
+RingBuffer:
+    A preallocated NumPy array written circularly, read in chronological order.
+
+Dependencies:
+-------------
+- numpy: Library for numerical operations.
+"""
+import numpy as np
+
+class RingBuffer:
+    """
+    A fixed-size buffer of the last values written, stored in a preallocated array.
+
+    The write position and the number of values stored are public, so that readers
+    can check how much signal is available.
+    """
+
+    def __init__(self, size: int, dtype: type = np.float32) -> None:
+        """
+        Allocate the buffer, initially empty.
+        """
+        self.data = np.zeros(size, dtype=dtype)
+        self.pos = 0
+        self.count = 0
+
+    def write(self, values: np.ndarray) -> None:
+        """
+        Write values at the write position, wrapping around the end of the buffer and
+        overwriting the oldest values.
+
+        Of more values than the buffer holds, such as a catch-up batch of the sensor
+        reader, only the last ones are kept.
+        """
+        size = len(self.data)
+        if len(values) > size:
+            # Only the last size values would be left once the others are overwritten
+            values = values[-size:]
+        end = self.pos + len(values)
+        if end <= size:
+            self.data[self.pos:end] = values
+        else:
+            split = size - self.pos
+            self.data[self.pos:] = values[:split]
+            self.data[:end - size] = values[split:]
+        self.pos = end % size
+        self.count = min(self.count + len(values), size)
+
+    def view(self) -> np.ndarray:
+        """
+        Get the content of the buffer in chronological order.
+
+        Until the buffer has wrapped around, or when its oldest value is at the start,
+        this is a view without copy.
+        """
+        if self.count < len(self.data):
+            return self.data[:self.count]
+        if self.pos == 0:
+            return self.data
+        return np.concatenate((self.data[self.pos:], self.data[:self.pos]))
+
+    def tail(self, length: int) -> np.ndarray:
+        """
+        Copy the last values written, in chronological order.
+
+        Only those values are copied, even when the buffer has wrapped around.
+        """
+        if length <= self.pos:
+            return self.data[self.pos - length:self.pos].copy()
+        return np.concatenate((self.data[self.pos - length:], self.data[:self.pos]))
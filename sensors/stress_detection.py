@@ -17,32 +17,61 @@ Key Features:
 -------------
 - Real-time stress level detection using ECG and EDA data.
 - Visualization of ECG trace and stress level evolution using Pygame.
-- Logging of stress states with timestamps.
+- Logging of stress states with timestamps, written in batches by a background thread.
 - Automatic sensor reconnection and calibration.
+- Sensor reads and metric calculations in dedicated threads, so that the display never
+  waits for them.
 
 Dependencies:
 -------------
 - bitalino: Library to interface with the BITalino sensor.
 - numpy: Library for numerical operations.
 - pygame: Library for creating the visual interface.
-- scipy: Library for signal processing.
 - matplotlib: Library for generating summary graphs.
-- portalocker: Library for file locking to ensure safe logging.
+- ecg_analysis: R peak detection and HRV metrics of the ECG signal.
+- ring_buffer: Fixed-size buffers of the last seconds of signal.
+- stress_log: Batched writing of the stress states to the log file.
 """
 from collections import deque
-import datetime
+from concurrent.futures import ThreadPoolExecutor
 import sys
+import threading
 import time
 import json
+import queue
 
 import bitalino
 import numpy as np
 import pygame
-from scipy.signal import find_peaks
 import matplotlib.pyplot as plt
-import portalocker
 import imageio
 
+try:
+    from .ecg_analysis import RPeakDetector, hrv_metrics
+    from .ring_buffer import RingBuffer
+    from .stress_log import StressLogWriter
+except ImportError:
+    # Run as a script (python sensors/stress_detection.py): the sensors directory is on
+    # the import path, but the module is not part of the sensors package
+    from ecg_analysis import RPeakDetector, hrv_metrics
+    from ring_buffer import RingBuffer
+    from stress_log import StressLogWriter
+
+def stress_change(value: float, baseline: float, increases: bool) -> float:
+    """
+    Compute the change of a metric from its baseline, in percent of the baseline,
+    clamped between 0 and 100.
+
+    For metrics that increase with stress (EDA, HR) an increase counts, for the
+    other ones (SDNN, RMSSD, PNN50) a decrease does.
+    """
+    reference = max(baseline, 1)
+    if increases:
+        change = (value - baseline) / reference
+    else:
+        change = (reference - value) / reference
+    return min(max(0, change) * 100, 100)
+
 class StressDetectionSystem:
     """
     A system for detecting stress levels using physiological data.
@@ -55,6 +84,9 @@ class StressDetectionSystem:
         """
         self.load_config()
         self.setup_logging()
+        # Blocks of samples read by the sensor thread, waiting to be processed
+        self.sample_blocks = deque()
+        self.reader_thread = None
         self.connect_sensor()
         self.initialize_variables()
         self.setup_display()
@@ -125,10 +157,8 @@ class StressDetectionSystem:
         """
         Set up logging to record stress levels.
         """
-        with open(self.log_filename, "w", encoding='utf-8') as file:
-            portalocker.lock(file, portalocker.LOCK_EX)
-            file.write("Timestamp,State\n")
-            portalocker.unlock(file)
+        # Stress states are written by a background thread, in batches
+        self.log_writer = StressLogWriter(self.log_filename)
 
     def connect_sensor(self) -> None:
         """
@@ -140,6 +170,7 @@ class StressDetectionSystem:
             print("BITalino sensor connected")
             self.device.start(self.sampling_rate, [0, 1])
             print("START")
+            self._start_reader()
         except Exception as e:
             print(f"BITalino-specific error: {e}")
             sys.exit()
@@ -153,40 +184,128 @@ class StressDetectionSystem:
             print(f"Invalid parameter value: {e}")
             sys.exit()
 
+    def _start_reader(self) -> None:
+        """
+        Start the thread reading the sensor, so that the display never waits for it.
+
+        The thread gets its own stop event and device, so that it never reads from a
+        device connected after it was stopped.
+        """
+        self.reader_stop = threading.Event()
+        self.reader_failed = False
+        self.reader_thread = threading.Thread(target=self._reader_loop,
+                                              args=(self.reader_stop, self.device),
+                                              daemon=True)
+        self.reader_thread.start()
+
+    def _stop_reader(self) -> None:
+        """
+        Stop the sensor reading thread, waiting until it has exited.
+
+        The device must not be closed, nor a new reader started, while the thread may
+        still be in a read.
+        """
+        if self.reader_thread is not None:
+            self.reader_stop.set()
+            self.reader_thread.join(timeout=1)
+            while self.reader_thread.is_alive():
+                print("Waiting for the sensor read in progress...")
+                self.reader_thread.join(timeout=1)
+            self.reader_thread = None
+
+    def _reader_loop(self, stop: threading.Event, device: bitalino.BITalino) -> None:
+        """
+        Read blocks of samples from the device until stopped or until a read fails.
+
+        deque.append is thread-safe, so the blocks are handed to process_data without
+        a lock.
+        """
+        while not stop.is_set():
+            try:
+                self.sample_blocks.append(device.read(self.num_frames))
+            except OSError as e:
+                print(f"Operating system error while reading data: {e}")
+                self.reader_failed = True
+                return
+            except ValueError as e:
+                print(f"Value error while reading data: {e}")
+                self.reader_failed = True
+                return
+            except RuntimeError as e:
+                print(f"Runtime error while reading data: {e}")
+                self.reader_failed = True
+                return
+
     def setup_video_recording(self) -> None:
         """
         Set up video recording using OpenCV.
         """
         self.video_filename = self.config['PATHS']['VIDEO_FILE']
         self.video_writer = imageio.get_writer(self.video_filename, fps=30)
-    
+        # Frames are encoded by a background thread, so that the display does not wait
+        # for each encoding. A few frames are buffered; when the encoder falls further
+        # behind, the frames that could not be queued are counted as dropped.
+        self.frame_queue = queue.Queue(maxsize=4)
+        self.dropped_frames = 0
+        self.encoder_failed = False
+        self.encoder_thread = threading.Thread(target=self._encoder_loop, daemon=True)
+        self.encoder_thread.start()
+
+    def _encoder_loop(self) -> None:
+        """
+        Write the queued frames to the video file, until the None sentinel is queued
+        or until the encoder fails, which stops the recording.
+        """
+        while True:
+            frame = self.frame_queue.get()
+            if frame is None:
+                return
+            try:
+                self.video_writer.append_data(frame)
+            except (OSError, ValueError, RuntimeError) as e:
+                print(f"Error recording frame, video recording stopped: {e}")
+                self.encoder_failed = True
+                return
+
     def record_frame(self) -> None:
         """
-        Capture the current Pygame screen and write it to the video file.
+        Capture the current Pygame screen and queue it for the encoder thread.
         """
-        if self.video_writer is None:
+        if self.video_writer is None or self.encoder_failed:
             return
 
         try:
-            # Get the current Pygame surface as a numpy array
-            frame = pygame.surfarray.array3d(self.screen)
-            # Convert from (width, height, 3) to (height, width, 3)
-            frame = np.transpose(frame, (1, 0, 2))
-            # Write the frame to the video file
-            self.video_writer.append_data(frame)
-        except Exception as e:
+            # Copy the screen row by row, which is already the (height, width, 3) layout
+            # of a video frame
+            frame = np.frombuffer(pygame.image.tobytes(self.screen, 'RGB'), dtype=np.uint8)
+            frame = frame.reshape(self.window_size[1], self.window_size[0], 3)
+        except (ValueError, pygame.error) as e:
             print(f"Error recording frame: {e}")
+            return
+
+        try:
+            # Wait up to one frame period, so that a slow encoder slows the loop down
+            # rather than making the 30 fps video play faster than real time
+            self.frame_queue.put(frame, timeout=1 / 30)
+        except queue.Full:
+            self.dropped_frames += 1
 
     def initialize_variables(self) -> None:
         """
         Initialize variables and data buffers.
         """
-        self.ecg_values = []
-        self.ecg_buffer = []
-        self.eda_buffer = []
+        # Last 20 seconds of signal, in fixed-size ring buffers written in place
+        buffer_size = 20 * self.sampling_rate
+        self.ecg_buffer = RingBuffer(buffer_size)
+        self.eda_buffer = RingBuffer(buffer_size)
+        self.r_peak_detector = RPeakDetector(buffer_size)
+        # Single thread calculating the metrics, so that the display never waits for them
+        self.metrics_executor = ThreadPoolExecutor(max_workers=1)
+        self.metrics_future = None
 
         self.heart_rate = 0
         self.hrv_metrics = {"SDNN": 0, "RMSSD": 0, "PNN50": 0}
+        self._update_hrv_texts()
         self.last_eda_value = 0.0
         self.last_ecg_value = 0.0
 
@@ -197,10 +316,14 @@ class StressDetectionSystem:
 
         self.stress_history = deque(maxlen=300)
         self.time_history = deque(maxlen=300)
-
-        self.start_time = time.time()
-        self.last_calculation_time = time.time()
-        self.last_reconnect_time = time.time()
+        # Points of the stress curve, rebuilt only when the stress history changes
+        self.stress_points = []
+        self.stress_points_dirty = False
+
+        # Monotonic clock times, unaffected by changes of the system clock
+        self.start_time = time.monotonic()
+        self.last_calculation_time = self.start_time
+        self.last_reconnect_time = self.start_time
         self.recording_duration = 0
         self.analysis_started = False
         self.current_stress_level = 0
@@ -215,10 +338,16 @@ class StressDetectionSystem:
                             int(screen_info.current_h * 0.9) // 16 * 16)
         self.screen = pygame.display.set_mode(self.window_size)
         pygame.display.set_caption("Stress Detection System - Futuristic Interface")
+        self.clock = pygame.time.Clock()
+        # Closing the window is the only event handled: the other ones are not queued
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT])
 
         self.font = pygame.font.SysFont("Arial", 30)
         self.hud_font = pygame.font.SysFont("Arial", 25)
         self.status_font = pygame.font.SysFont("Arial", 40)
+        # Rendered text surfaces, keyed by (font, text, color)
+        self.text_cache = {}
 
         self.background_color = (20, 20, 20)
         self.text_color = (0, 255, 0)
@@ -229,6 +358,54 @@ class StressDetectionSystem:
         self.calm_color = (0, 255, 150)
         self.stress_color = (255, 50, 50)
 
+        # Ring buffer of the last ECG value of each read, one per trace point
+        self.ecg_values = RingBuffer(self.window_size[0])
+        # X coordinates of the trace points, the newest one at the right edge of the window
+        self.ecg_trace_x = (self.window_size[0]
+                            - 2 * np.arange(self.window_size[0] - 1, -1, -1)).astype(np.float32)
+
+        self._setup_layout()
+
+    def _setup_layout(self) -> None:
+        """
+        Compute the positions and render the texts of the display that never change.
+        """
+        self.stress_color_lut = tuple(self._interpolate_stress_color(i / 10) for i in range(1001))
+
+        height = self.window_size[1]
+        # Color and position of the EDA, ECG, HR, SDNN, RMSSD and PNN50 lines
+        self.metric_layout = (
+            (self.text_color, (30, 120)), (self.ecg_color, (30, height - 300)),
+            (self.text_color, (30, height - 250)), (self.text_color, (30, height - 200)),
+            (self.text_color, (30, height - 150)), (self.text_color, (30, height - 100))
+        )
+
+        area = pygame.Rect(800, 250, 500, 150)
+        self.stress_area = area
+        stress_title = self.font.render("Stress Level Evolution", True, self.text_color)
+
+        # Background with the static texts and shapes, blitted at each frame instead of
+        # drawing them again
+        self.background = pygame.Surface(self.window_size).convert()
+        self.background.fill(self.background_color)
+        self.background.blit(self.hud_font.render("STRESS DETECTION SYSTEM", True, self.text_color),
+                             (30, 30))
+
+        # Same background with the frame, axes and ticks of the stress curve
+        self.curve_background = self.background.copy()
+        pygame.draw.rect(self.curve_background, self.text_color, area, 1)
+        pygame.draw.line(self.curve_background, self.text_color,
+                         (area.left, area.bottom), (area.right, area.bottom), 1)
+        pygame.draw.line(self.curve_background, self.text_color,
+                         (area.left, area.top), (area.left, area.bottom), 1)
+        self.curve_background.blit(stress_title, (area.left, area.top - 50))
+        for i in range(0, 101, 25):
+            y_pos = area.bottom - (i / 100 * area.height)
+            pygame.draw.line(self.curve_background, self.text_color,
+                             (area.left - 5, y_pos), (area.left, y_pos), 1)
+            self.curve_background.blit(self.font.render(f"{i}", True, self.text_color),
+                                       (area.left - 25, y_pos - 10))
+
     def calculate_hr_from_raw(self, ecg_data: np.ndarray, sampling_rate: int = 1000) -> tuple:
         """
         Calculate heart rate and HRV metrics from raw ECG data.
@@ -237,29 +414,13 @@ class StressDetectionSystem:
             return 0, 0, 0, 0
 
         try:
-            normalized_ecg = (ecg_data - np.mean(ecg_data)) / np.std(ecg_data)
-            peaks, _ = find_peaks(normalized_ecg, height=0.5, distance=sampling_rate//3)
-            if len(peaks) < 2:
-                peaks, _ = find_peaks(normalized_ecg, height=0.3, distance=sampling_rate//4)
+            peaks = self.r_peak_detector.detect(ecg_data, sampling_rate)
 
             if len(peaks) < 2:
                 print("No R peaks found in raw ECG data.")
                 return 0, 0, 0, 0
 
-            rr_intervals = np.diff(peaks) / sampling_rate
-            heart_rate = 60 / np.mean(rr_intervals)
-            sdnn = np.std(rr_intervals) * 1000
-            rmssd = np.sqrt(np.mean(np.square(np.diff(rr_intervals)))) * 1000
-
-            if len(rr_intervals) < 2:
-                pnn50 = 0
-            else:
-                rr_intervals_ms = rr_intervals * 1000
-                nn_diffs = np.abs(np.diff(rr_intervals_ms))
-                nn50 = sum(nn_diffs > 50)
-                pnn50 = (nn50 / len(nn_diffs)) * 100 if len(nn_diffs) > 0 else 0
-
-            return heart_rate, sdnn, rmssd, pnn50
+            return hrv_metrics(peaks, float(sampling_rate))
 
         except ValueError as e:
             print(f"Value error in HR calculation: {e}")
@@ -276,40 +437,37 @@ class StressDetectionSystem:
         """
         Calculate stress level based on physiological parameters.
         """
-        weights = {
-            "EDA": self.eda_weight, "HR": self.hr_weight,
-            "SDNN": self.sdnn_weight, "RMSSD": self.rmssd_weight,
-            "PNN50": self.pnn50_weight
-        }
-
-        eda_change = min(max(0, (eda - baseline["EDA"]) / max(baseline["EDA"], 1)) * 100, 100)
-        hr_change = min(max(0, (hr - baseline["HR"]) / max(baseline["HR"], 1)) * 100, 100)
-        sdnn_change = min(max(0, (max(baseline["SDNN"], 1) - sdnn)
-                              / max(baseline["SDNN"], 1)) * 100, 100)
-        rmssd_change = min(max(0, (max(baseline["RMSSD"], 1) - rmssd)
-                               / max(baseline["RMSSD"], 1)) * 100, 100)
-        pnn50_change = min(max(0, (max(baseline["PNN50"], 1) - pnn50)
-                               / max(baseline["PNN50"], 1)) * 100, 100)
-
         stress_level = (
-            weights["EDA"] * eda_change +
-            weights["HR"] * hr_change +
-            weights["SDNN"] * sdnn_change +
-            weights["RMSSD"] * rmssd_change +
-            weights["PNN50"] * pnn50_change
+            self.eda_weight * stress_change(eda, baseline["EDA"], True) +
+            self.hr_weight * stress_change(hr, baseline["HR"], True) +
+            self.sdnn_weight * stress_change(sdnn, baseline["SDNN"], False) +
+            self.rmssd_weight * stress_change(rmssd, baseline["RMSSD"], False) +
+            self.pnn50_weight * stress_change(pnn50, baseline["PNN50"], False)
         )
 
         return max(0, min(stress_level, 100))
 
     def draw_background(self) -> None:
         """
-        Draw the background of the display.
+        Draw the background of the display, with the stress curve frame once it is drawn.
         """
-        self.screen.fill(self.background_color)
+        if self.calibration_complete and len(self.stress_history) >= 2:
+            self.screen.blit(self.curve_background, (0, 0))
+        else:
+            self.screen.blit(self.background, (0, 0))
 
     def get_stress_color(self, stress_level : int = 0) -> tuple:
         """
         Get a color between CALM_COLOR and STRESS_COLOR based on stress level.
+
+        The colors are looked up per tenth of percent, the resolution of the display,
+        in the table built by _setup_layout.
+        """
+        return self.stress_color_lut[min(1000, max(0, int(stress_level * 10)))]
+
+    def _interpolate_stress_color(self, stress_level : int = 0) -> tuple:
+        """
+        Compute the color between CALM_COLOR and STRESS_COLOR for a stress level.
         """
         color_factor = stress_level / 100.0
         return (
@@ -318,64 +476,83 @@ class StressDetectionSystem:
             int(self.calm_color[2] + (self.stress_color[2] - self.calm_color[2]) * color_factor)
         )
 
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Render a text, reusing the surface rendered for the same font, text and color.
+        """
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= 256:
+                # The cache only grows with the changing metric values: start over
+                self.text_cache.clear()
+            # Converted to the display format, which makes the blits of each frame faster
+            surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = surface
+        return surface
+
+    def _update_hrv_texts(self) -> None:
+        """
+        Format the HUD texts of the heart rate and HRV metrics, when they change.
+        """
+        self.hrv_texts = (
+            f"HR: {self.heart_rate:.2f} bpm",
+            f"SDNN: {self.hrv_metrics['SDNN']:.2f}",
+            f"RMSSD: {self.hrv_metrics['RMSSD']:.2f}",
+            f"PNN50: {self.hrv_metrics['PNN50']:.2f}%"
+        )
+
     def draw_hud(self) -> None:
         """
         Display HUD interface with all metrics.
         """
-        title_text = self.hud_font.render("STRESS DETECTION SYSTEM", True, self.text_color)
-        self.screen.blit(title_text, (30, 30))
+        blit = self.screen.blit
+        render_text = self._render_text
+        font = self.font
 
-        time_text = self.font.render(f"Time: {self.recording_duration:.1f}s", True, self.text_color)
-        self.screen.blit(time_text, (30, 70))
+        time_text = render_text(font, f"Time: {self.recording_duration:.1f}s", self.text_color)
+        blit(time_text, (30, 70))
 
         if not self.calibration_complete:
-            status_text = self.status_font.render("CALIBRATION IN PROGRESS...", True, self.neon_blue)
-            self.screen.blit(status_text, (self.window_size[0] // 2 - 250,
-                                           self.window_size[1] // 2 - 50))
-
-        metrics = [
-            (f"EDA: {self.last_eda_value:.2f}", 120, self.text_color),
-            (f"ECG: {self.last_ecg_value:.2f}", self.window_size[1] - 300, self.ecg_color),
-            (f"HR: {self.heart_rate:.2f} bpm", self.window_size[1] - 250, self.text_color),
-            (f"SDNN: {self.hrv_metrics['SDNN']:.2f}", self.window_size[1] - 200, self.text_color),
-            (f"RMSSD: {self.hrv_metrics['RMSSD']:.2f}", self.window_size[1] - 150, self.text_color),
-            (f"PNN50: {self.hrv_metrics['PNN50']:.2f}%", self.window_size[1] - 100, self.text_color)
-        ]
-
-        for text, y_pos, color in metrics:
-            self.screen.blit(self.font.render(text, True, color), (30, y_pos))
+            status_text = render_text(self.status_font, "CALIBRATION IN PROGRESS...",
+                                      self.neon_blue)
+            blit(status_text, (self.window_size[0] // 2 - 250, self.window_size[1] // 2 - 50))
+
+        metrics = (f"EDA: {self.last_eda_value:.2f}", f"ECG: {self.last_ecg_value:.2f}",
+                   *self.hrv_texts)
+
+        for text, (color, position) in zip(metrics, self.metric_layout):
+            blit(render_text(font, text, color), position)
 
         if self.calibration_complete:
             stress_color = self.get_stress_color(self.current_stress_level)
-            stress_text = self.status_font.render(f"STRESS: {self.current_stress_level:.1f}%",
-                                                  True, stress_color)
-            self.screen.blit(stress_text, (self.window_size[0] - 350, 50))
+            stress_text = render_text(self.status_font, f"STRESS: {self.current_stress_level:.1f}%",
+                                      stress_color)
+            blit(stress_text, (self.window_size[0] - 350, 50))
 
             if self.current_stress_level < self.calm_threshold:
-                state_text = self.font.render("State: CALM", True, self.calm_color)
+                state_text = render_text(font, "State: CALM", self.calm_color)
             elif self.current_stress_level < self.moderate_threshold:
-                state_text = self.font.render("State: MODERATE TENSION", True, (255, 255, 0))
+                state_text = render_text(font, "State: MODERATE TENSION", (255, 255, 0))
             else:
-                state_text = self.font.render("State: HIGH STRESS", True, self.stress_color)
-            self.screen.blit(state_text, (self.window_size[0] - 350, 150))
+                state_text = render_text(font, "State: HIGH STRESS", self.stress_color)
+            blit(state_text, (self.window_size[0] - 350, 150))
 
     def draw_ecg_trace(self) -> None:
         """
         Draw the ECG trace visualization.
         """
-        if len(self.ecg_values) < 2:
+        if self.ecg_values.count < 2:
             return
 
         ecg_area_height = 100
         ecg_area_top = self.window_size[1] - 150
         scale_factor = 5
 
-        for i in range(1, len(self.ecg_values)):
-            x1 = self.window_size[0] - (len(self.ecg_values) - i) * 2
-            x2 = self.window_size[0] - (len(self.ecg_values) - i - 1) * 2
-            y1 = ecg_area_top + ecg_area_height / 2 - self.ecg_values[i - 1] / scale_factor
-            y2 = ecg_area_top + ecg_area_height / 2 - self.ecg_values[i] / scale_factor
-            pygame.draw.line(self.screen, self.ecg_color, (x1, y1), (x2, y2), 2)
+        ecg_values = self.ecg_values.view()
+        ys = (ecg_area_top + ecg_area_height / 2) - ecg_values / scale_factor
+        points = np.column_stack((self.ecg_trace_x[-len(ecg_values):], ys))
+        pygame.draw.lines(self.screen, self.ecg_color, False, points.tolist(), 2)
 
     def draw_stress_curve(self) -> None:
         """
@@ -384,36 +561,10 @@ class StressDetectionSystem:
         if len(self.stress_history) < 2:
             return
 
-        area = {
-            'width': 500, 'height': 150,
-            'left': 800, 'top': 250
-        }
-
-        pygame.draw.rect(self.screen, self.text_color,
-                         (area['left'], area['top'], area['width'], area['height']), 1)
-        pygame.draw.line(self.screen, self.text_color,
-                         (area['left'], area['top'] + area['height']),
-                         (area['left'] + area['width'], area['top'] + area['height']), 1)
-        pygame.draw.line(self.screen, self.text_color,
-                         (area['left'], area['top']),
-                         (area['left'], area['top'] + area['height']), 1)
-
-        curve_title = self.font.render("Stress Level Evolution", True, self.text_color)
-        self.screen.blit(curve_title, (area['left'], area['top'] - 50))
-
-        for i in range(0, 101, 25):
-            y_pos = area['top'] + area['height'] - (i / 100 * area['height'])
-            pygame.draw.line(self.screen, self.text_color,
-                             (area['left'] - 5, y_pos), (area['left'], y_pos), 1)
-            y_label = self.font.render(f"{i}", True, self.text_color)
-            self.screen.blit(y_label, (area['left'] - 25, y_pos - 10))
-
-        points = []
-        for i, stress in enumerate(self.stress_history):
-            if i >= len(self.stress_history) - area['width']//2:
-                x = area['left'] + (i - (len(self.stress_history) - area['width']//2)) * 2
-                y = area['top'] + area['height'] - (stress / 100 * area['height'])
-                points.append((x, y))
+        # The frame, axes, ticks and title are part of the background
+        if self.stress_points_dirty:
+            self._update_stress_points()
+        points = self.stress_points
 
         if len(points) >= 2:
             pygame.draw.lines(self.screen, self.neon_blue, False, points, 2)
@@ -422,11 +573,29 @@ class StressDetectionSystem:
                                points[-1],
                                5)
 
+    def _update_stress_points(self) -> None:
+        """
+        Compute the points of the stress curve from the stress history.
+
+        The last values of the history fit the curve area, 2 pixels apart, the newest
+        one at the right of the area.
+        """
+        area = self.stress_area
+        max_points = area.width // 2
+        history = np.fromiter(self.stress_history, dtype=np.float64)[-max_points:]
+        offsets = np.arange(max_points - len(history), max_points)
+        xs = area.left + offsets * 2
+        ys = area.bottom - history / 100 * area.height
+        self.stress_points = np.column_stack((xs, ys)).tolist()
+        self.stress_points_dirty = False
+
     def log_stress_state(self, stress_level : int) -> None:
         """
-        Record stress state to the log file.
+        Queue a stress state to be written to the log file by the log writer thread.
         """
-        timestamp_now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        now = time.time()
+        timestamp_now = (f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))}"
+                         f".{int(now % 1 * 1000):03d}")
 
         if stress_level < self.calm_threshold:
             state = "CALM"
@@ -435,13 +604,7 @@ class StressDetectionSystem:
         else:
             state = "STRESSED"
 
-        try:
-            with open(self.log_filename, "a", encoding='utf-8') as file:
-                portalocker.lock(file, portalocker.LOCK_EX)
-                file.write(f"{timestamp_now},{state}\n")
-                portalocker.unlock(file)
-        except Exception as e:
-            print(f"Error writing to log file: {e}")
+        self.log_writer.log(f"{timestamp_now},{state}\n")
 
     def calibrate(self) -> None:
         """
@@ -449,52 +612,55 @@ class StressDetectionSystem:
         """
         print("Calibration complete, starting real-time analysis...")
 
-        if len(self.ecg_buffer) >= 20 * self.sampling_rate * 0.8:
+        if self.ecg_buffer.count >= 20 * self.sampling_rate * 0.8:
             calculated_hr, calculated_sdnn, calculated_rmssd, calculated_pnn50 = self.calculate_hr_from_raw(
-                np.array(self.ecg_buffer), self.sampling_rate)
+                self.ecg_buffer.view(), self.sampling_rate)
             self.calibration_values["HR"] = calculated_hr if calculated_hr > 0 else 70
             self.calibration_values["SDNN"] = calculated_sdnn if calculated_sdnn > 0 else 50
             self.calibration_values["RMSSD"] = calculated_rmssd if calculated_rmssd > 0 else 30
             self.calibration_values["PNN50"] = calculated_pnn50 if calculated_pnn50 > 0 else 10
 
-        if len(self.eda_buffer) > 0:
-            self.calibration_values["EDA"] = np.mean(self.eda_buffer)
+        if self.eda_buffer.count > 0:
+            self.calibration_values["EDA"] = np.mean(self.eda_buffer.view())
 
         print(f"Calibration values: {self.calibration_values}")
 
     def process_data(self) -> bool:
         """
-        Process new data from the sensor.
+        Process the blocks of samples read from the sensor since the last call.
+
+        Returns False when the sensor thread stopped on an error or when the data
+        is invalid, to end the recording.
         """
         try:
-            data = self.device.read(self.num_frames)
+            sample_blocks = self.sample_blocks
+            block_count = len(sample_blocks)
+            if block_count == 0:
+                return not self.reader_failed
+            if block_count == 1:
+                data = sample_blocks.popleft()
+            else:
+                # Ingest all the pending blocks with one assignment per buffer
+                data = np.concatenate([sample_blocks.popleft() for _ in range(block_count)])
 
-            if np.mean(data[:, 1]) < 1:
+            # Rejected when the mean of the digital input is below 1, tested on the sum
+            # so that no division is needed
+            digital = data[:, 1]
+            if digital.sum() < len(digital):
                 return False
 
-            eda = data[:, 5]
-            ecg = data[:, 6]
+            eda = data[:, 5].astype(np.float32)
+            ecg = data[:, 6].astype(np.float32)
             self.last_eda_value = eda[-1]
             self.last_ecg_value = ecg[-1]
 
-            self.eda_buffer.extend(eda)
-            self.ecg_values.append(self.last_ecg_value)
-            self.ecg_buffer.extend(ecg)
-
-            if len(self.ecg_values) > self.window_size[0]:
-                self.ecg_values.pop(0)
+            self.eda_buffer.write(eda)
+            self.ecg_buffer.write(ecg)
+            # The ECG trace receives the last ECG sample of each block of num_frames samples
+            self.ecg_values.write(ecg[self.num_frames - 1::self.num_frames])
 
-            buffer_size = 20 * self.sampling_rate
-            if len(self.ecg_buffer) > buffer_size:
-                self.ecg_buffer = self.ecg_buffer[-buffer_size:]
-            if len(self.eda_buffer) > buffer_size:
-                self.eda_buffer = self.eda_buffer[-buffer_size:]
+            return not self.reader_failed
 
-            return True
-
-        except OSError as e:
-            print(f"Operating system error while reading data: {e}")
-            return False
         except ValueError as e:
             print(f"Value error while processing data: {e}")
             return False
@@ -507,27 +673,53 @@ class StressDetectionSystem:
 
     def update_metrics(self) -> None:
         """
-        Calculate metrics from buffer data.
-        """
-        if len(self.ecg_buffer) >= 20 * self.sampling_rate * 0.9:
-            calculated_hr,calculated_sdnn, calculated_rmssd, calculated_pnn50 = self.calculate_hr_from_raw(
-                np.array(self.ecg_buffer), self.sampling_rate)
+        Start the calculation of the metrics from buffer data in the metrics thread.
 
-            if calculated_hr > 0:
-                self.heart_rate = calculated_hr
-                self.hrv_metrics["SDNN"] = calculated_sdnn
-                self.hrv_metrics["RMSSD"] = calculated_rmssd
-                self.hrv_metrics["PNN50"] = calculated_pnn50
+        The results are applied by _collect_metrics once the calculation is done. No
+        calculation is started while the previous one is still running.
+        """
+        if self.metrics_future is not None:
+            return
+        if self.ecg_buffer.count >= 20 * self.sampling_rate * 0.9:
+            # Copies, since the ring buffers keep being written during the calculation
+            ecg_values = np.array(self.ecg_buffer.view())
+            eda_values = self.eda_buffer.tail(int(self.eda_buffer.count*0.2))
+            self.metrics_future = self.metrics_executor.submit(
+                self._compute_metrics, ecg_values, eda_values)
 
-                mean_eda = np.mean(self.eda_buffer[-int(len(self.eda_buffer)*0.2):])
-                self.current_stress_level = self.analyze_stress_level(
-                    mean_eda, self.heart_rate, calculated_sdnn, calculated_rmssd, calculated_pnn50,
-                    self.calibration_values
-                )
+    def _compute_metrics(self, ecg_values: np.ndarray, eda_values: np.ndarray) -> tuple:
+        """
+        Calculate the heart rate, the HRV metrics and the mean EDA, in the metrics thread.
+        """
+        return (*self.calculate_hr_from_raw(ecg_values, self.sampling_rate),
+                np.mean(eda_values))
 
-                self.stress_history.append(self.current_stress_level)
-                self.time_history.append(self.recording_duration)
-                self.log_stress_state(self.current_stress_level)
+    def _collect_metrics(self) -> None:
+        """
+        Apply the metrics calculated by the metrics thread, once they are available.
+        """
+        if self.metrics_future is None or not self.metrics_future.done():
+            return
+        (calculated_hr, calculated_sdnn, calculated_rmssd, calculated_pnn50,
+         mean_eda) = self.metrics_future.result()
+        self.metrics_future = None
+
+        if calculated_hr > 0:
+            self.heart_rate = calculated_hr
+            self.hrv_metrics["SDNN"] = calculated_sdnn
+            self.hrv_metrics["RMSSD"] = calculated_rmssd
+            self.hrv_metrics["PNN50"] = calculated_pnn50
+            self._update_hrv_texts()
+
+            self.current_stress_level = self.analyze_stress_level(
+                mean_eda, self.heart_rate, calculated_sdnn, calculated_rmssd, calculated_pnn50,
+                self.calibration_values
+            )
+
+            self.stress_history.append(self.current_stress_level)
+            self.stress_points_dirty = True
+            self.time_history.append(self.recording_duration)
+            self.log_stress_state(self.current_stress_level)
 
     def generate_summary(self) -> None:
         """
@@ -550,6 +742,9 @@ class StressDetectionSystem:
         Clean up resources.
         """
         print("STOP")
+        self._stop_reader()
+        self.metrics_executor.shutdown()
+        self.log_writer.close()
         try:
             self.device.trigger([0, 0])
             self.device.stop()
@@ -559,6 +754,17 @@ class StressDetectionSystem:
             print(f"Error cleaning up device: {e}")
             
         if hasattr(self, 'video_writer') and self.video_writer is not None:
+            # Let the encoder thread write the frames still queued
+            while self.encoder_thread.is_alive():
+                try:
+                    self.frame_queue.put(None, timeout=1)
+                    break
+                except queue.Full:
+                    pass
+            self.encoder_thread.join()
+            if self.dropped_frames:
+                print(f"{self.dropped_frames} frames dropped from the video, "
+                      "which plays faster than real time by as much")
             try:
                 self.video_writer.close()  # Release the video writer
                 print(f"Video saved in file '{self.video_filename}'")
@@ -574,7 +780,7 @@ class StressDetectionSystem:
         self.setup_video_recording()  # Initialize video recording
         running = True
         while running:
-            current_time = time.time()
+            current_time = time.monotonic()
             self.recording_duration = current_time - self.start_time
 
             if self.recording_duration >= 20 and not self.calibration_complete:
@@ -582,13 +788,13 @@ class StressDetectionSystem:
                 self.calibrate()
                 self.analysis_started = True
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
+            if pygame.event.get(pygame.QUIT):
+                running = False
 
             if current_time - self.last_reconnect_time >= 60:
                 print("Automatic reconnection attempt...")
                 #self.device.stop()
+                self._stop_reader()
                 self.device.close()
                 self.connect_sensor()
                 self.last_reconnect_time = current_time
@@ -599,6 +805,7 @@ class StressDetectionSystem:
             if self.analysis_started and current_time - self.last_calculation_time >= 1.0:
                 self.update_metrics()
                 self.last_calculation_time = current_time
+            self._collect_metrics()
 
             self.draw_background()
             self.draw_hud()
@@ -609,7 +816,8 @@ class StressDetectionSystem:
 
             pygame.display.flip()
             self.record_frame()  # Record the current frame
-            pygame.time.delay(10)
+            # The video is recorded at 30 fps: drawing more often is not seen anywhere
+            self.clock.tick(30)
 
         self.cleanup()
         self.generate_summary()
@@ -0,0 +1,95 @@
+"""
+Stress Log Module
+=================
+
+This module implements the log file in which the stress detection system records
+the stress states, read by the game to adapt its difficulty. States are queued by
+the caller and written in batches by a background thread, so that the file locking
+never blocks the display.
+
+Classes:
+--------
+StressLogWriter:
+    Writes the queued stress states to the log file, once a second.
+
+Dependencies:
+-------------
+- portalocker: Library for file locking to ensure safe logging.
+"""
+import queue
+import threading
+
+import portalocker
+
+class StressLogWriter:
+    """
+    Writer of the stress log file, in batches, from a background thread.
+
+    The file is kept open until close, so that each batch is only a lock, a write and
+    a flush.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Create the log file with its header and start the writer thread.
+        """
+        # Closed by close, once the writer thread is done
+        self.file = open(  # pylint: disable=consider-using-with
+            filename, "w", encoding='utf-8')
+        portalocker.lock(self.file, portalocker.LOCK_EX)
+        self.file.write("Timestamp,State\n")
+        self.file.flush()
+        portalocker.unlock(self.file)
+
+        self.queue = queue.SimpleQueue()
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self.writer_loop, daemon=True)
+        self.thread.start()
+
+    def log(self, line: str) -> None:
+        """
+        Queue a line to be written to the log file by the writer thread.
+        """
+        self.queue.put(line)
+
+    def writer_loop(self) -> None:
+        """
+        Write the queued lines to the log file every second until stopped.
+
+        The game polls the log every 2 seconds: flushing more often than that keeps
+        the batching from delaying its stress feedback by more than one poll.
+        """
+        while not self.stop.wait(1):
+            self.flush()
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all the queued lines to the log file, locking it once.
+        """
+        lines = []
+        try:
+            while True:
+                lines.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not lines:
+            return
+
+        try:
+            portalocker.lock(self.file, portalocker.LOCK_EX)
+            self.file.write("".join(lines))
+            # Flushed before unlocking, so that readers see whole batches
+            self.file.flush()
+            portalocker.unlock(self.file)
+        except (OSError, portalocker.exceptions.LockException) as e:
+            print(f"Error writing to log file: {e}")
+
+    def close(self) -> None:
+        """
+        Stop the writer thread, after it wrote the lines still queued, and close the
+        log file.
+        """
+        self.stop.set()
+        self.thread.join()
+        self.file.close()